@@ -38,6 +38,7 @@ See Also:
     - :class:`TreesitterPython`: Equivalent for Python parsing.
 """
 import logging
+from functools import lru_cache
 from itertools import groupby
 from typing import Dict, List, Set
 
@@ -54,6 +55,17 @@ LANGUAGE: Language = Language(tsjava.language())
 PARSER: Parser = Parser(LANGUAGE)
 """Global Tree-sitter parser instance configured for Java."""
 
+QUERY_MATCH_LIMIT: int = 256
+"""Cap on in-progress matches per query, so deeply nested sources can't make a query go quadratic."""
+
+
+@lru_cache(maxsize=256)
+def _compile_query(query: str) -> Query:
+    """Compile an S-expression query against the Java grammar, once per distinct string."""
+    framed_query = LANGUAGE.query(query)
+    framed_query.set_match_limit(QUERY_MATCH_LIMIT)
+    return framed_query
+
 
 # pylint: disable=too-many-public-methods
 class TreesitterJava:
@@ -269,14 +281,21 @@ class TreesitterJava:
         Note:
             The query syntax follows Tree-sitter's S-expression format.
             See Tree-sitter documentation for query syntax details.
+            Compiled queries are cached by query string, so repeated calls
+            with the same query only pay for parsing ``code_to_process``.
+            Each query is capped at :data:`QUERY_MATCH_LIMIT` in-progress
+            matches; hitting the cap is logged as a warning.
 
         See Also:
             :class:`~cldk.analysis.commons.treesitter.models.Captures`:
                 The return type for captured nodes.
         """
-        framed_query: Query = LANGUAGE.query(query)
+        framed_query: Query = _compile_query(query)
         tree = PARSER.parse(bytes(code_to_process, "utf-8"))
-        return Captures(framed_query.captures(tree.root_node))
+        captures = framed_query.captures(tree.root_node)
+        if framed_query.did_exceed_match_limit:
+            logger.warning(f"Query {query!r} exceeded the match limit of {QUERY_MATCH_LIMIT}; some captures may be missing.")
+        return Captures(captures)
 
     def get_method_name_from_declaration(self, method_name_string: str) -> str:
         """Get the method name from the method signature."""
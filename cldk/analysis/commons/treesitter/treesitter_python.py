@@ -34,6 +34,8 @@ See Also:
     - :class:`TreesitterJava`: Equivalent for Java parsing.
 """
 
+import threading
+
 from tree_sitter import Language, Parser, Tree
 import tree_sitter_python as tspython
 
@@ -41,7 +43,30 @@ LANGUAGE: Language = Language(tspython.language())
 """The Tree-sitter Language object for Python grammar."""
 
 PARSER: Parser = Parser(LANGUAGE)
-"""Global Tree-sitter parser instance configured for Python."""
+"""Global Tree-sitter parser instance configured for Python.
+
+Kept for callers that import it directly; :class:`TreesitterPython` parses
+through a per-thread parser instead (see :func:`_parser`).
+"""
+
+_TLS = threading.local()
+
+
+def _parser() -> Parser:
+    """Return the calling thread's Python parser, creating it on first use.
+
+    A ``Parser`` is not safe to drive from several threads at once, so each
+    thread gets its own, built once and reused for every later parse.
+    """
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = Parser(LANGUAGE)
+    return parser
+
+
+def _as_bytes(code: str | bytes) -> bytes:
+    """Return ``code`` as UTF-8 bytes, passing already-encoded input through untouched."""
+    return code if isinstance(code, bytes) else code.encode("utf-8")
 
 
 class TreesitterPython:
@@ -51,11 +76,11 @@ class TreesitterPython:
     Tree-sitter. It offers syntax validation and raw AST generation for
     further analysis.
 
-    The class is stateless and thread-safe - it uses module-level parser
-    and language objects.
+    The class is stateless and thread-safe - each thread parses with its
+    own parser built from the module-level language object.
     """
 
-    def is_parsable(self, code: str) -> bool:
+    def is_parsable(self, code: str | bytes) -> bool:
         """Check if the given code is syntactically valid Python.
 
         Parses the code using Tree-sitter and recursively checks for ERROR
@@ -63,7 +88,8 @@ class TreesitterPython:
         code parses without syntax errors.
 
         Args:
-            code: A string containing Python source code to validate.
+            code: Python source code to validate, as a string or as
+                UTF-8 encoded bytes (passed to the parser without a copy).
                 Can be a complete module, a function, a class, or any
                 valid Python code fragment.
 
@@ -93,12 +119,16 @@ class TreesitterPython:
                 return True
             return False
 
-        tree = PARSER.parse(bytes(code, "utf-8"))
-        if tree is not None:
-            return not syntax_error(tree.root_node)
-        return False
+        tree = _parser().parse(_as_bytes(code))
+        if tree is None:
+            return False
+        # ``has_error`` is computed by the parser itself: when it is clear there is no ERROR node
+        # anywhere in the tree, so well-formed code skips the Python-level walk entirely.
+        if not tree.root_node.has_error:
+            return True
+        return not syntax_error(tree.root_node)
 
-    def get_raw_ast(self, code: str) -> Tree:
+    def get_raw_ast(self, code: str | bytes) -> Tree:
         """Parse code and return the Tree-sitter AST.
 
         Parses the provided Python source code using Tree-sitter and returns
@@ -106,7 +136,9 @@ class TreesitterPython:
         extract syntactic information about the code structure.
 
         Args:
-            code: A string containing Python source code to parse.
+            code: Python source code to parse, as a string or as UTF-8
+                encoded bytes. Callers that already hold the encoded
+                buffer should pass it directly to skip re-encoding.
 
         Returns:
             A Tree-sitter ``Tree`` object representing the parsed AST. The
@@ -123,4 +155,4 @@ class TreesitterPython:
         See Also:
             :meth:`is_parsable`: To validate syntax before parsing.
         """
-        return PARSER.parse(bytes(code, "utf-8"))
+        return _parser().parse(_as_bytes(code))
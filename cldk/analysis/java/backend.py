@@ -47,6 +47,7 @@ from cldk.models.java.models import (
     JMethodDetail,
     JType,
 )
+from cldk.models.java.enums import CRUDOperationType
 
 # A CRUD query row: the owning type + callable and the operations found within it.
 CRUDRow = Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]
@@ -187,6 +188,10 @@ class JavaAnalysisBackend(ABC):
     def get_all_delete_operations(self) -> List[CRUDRow]:
         """All delete operations."""
 
+    @abstractmethod
+    def get_crud_operations_by_type(self) -> Dict[CRUDOperationType, List[CRUDRow]]:
+        """The create/read/update/delete views, all built in a single traversal."""
+
     # -----[ comments / docstrings ]-----
     @abstractmethod
     def get_all_comments(self) -> Dict[str, List[JComment]]:
@@ -208,6 +213,10 @@ class JavaAnalysisBackend(ABC):
     def get_all_docstrings(self) -> List[Tuple[str, JComment]]:
         """All docstring-style comments across the application."""
 
+    @abstractmethod
+    def get_all_comments_and_docstrings(self) -> Tuple[Dict[str, List[JComment]], Dict[str, List[JComment]]]:
+        """``(get_all_comments(), get_all_docstrings())``, built in a single pass over the files."""
+
     @abstractmethod
     def remove_all_comments(self, src_code: str) -> str:
         """Strip all comments from the given source code."""
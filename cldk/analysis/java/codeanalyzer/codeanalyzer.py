@@ -26,6 +26,7 @@ from typing import Dict, List, Tuple
 from typing import Union
 
 import networkx as nx
+from pydantic import ValidationError
 
 from cldk.analysis import AnalysisLevel
 from cldk.analysis.java.backend import JavaAnalysisBackend
@@ -118,17 +119,18 @@ class JCodeanalyzer(JavaAnalysisBackend):
         return [str(java_bin), "-jar", str(self._locate_jar())]
 
     @staticmethod
-    def _init_japplication(data: str) -> JApplication:
+    def _init_japplication(data: str | bytes) -> JApplication:
         """Should return JApplication giving the stringified JSON as input.
+
+        The JSON text (or raw bytes) is validated directly by pydantic-core, without first
+        building an intermediate tree of Python dicts.
+
         Returns
         -------
         JApplication
             The application view of the Java code with the analysis results.
         """
-        # from ipdb import set_trace
-
-        # set_trace()
-        return JApplication(**json.loads(data))
+        return JApplication.model_validate_json(data)
 
     @staticmethod
     def check_exisiting_analysis_file_level(analysis_json_path_file: Path, analysis_level: int) -> bool:
@@ -156,6 +158,29 @@ class JCodeanalyzer(JavaAnalysisBackend):
                 analysis_file_compatible = False
         return analysis_file_compatible
 
+    @staticmethod
+    def _load_existing_analysis(analysis_json_path_file: Path, analysis_level: int) -> JApplication | None:
+        """Load a cached analysis file if it is compatible with the requested analysis level.
+
+        The same compatibility rules as :meth:`check_exisiting_analysis_file_level` apply, but the
+        file is read and validated only once.
+
+        Args:
+            analysis_json_path_file (Path): Path to the cached ``analysis.json`` file.
+            analysis_level (int): Requested analysis level (1=symbol table, 2=call graph).
+
+        Returns:
+            JApplication | None: The cached application, or None if the file is missing, is not a
+            valid analysis, or lacks the call graph a level 2 analysis needs.
+        """
+        try:
+            application = JCodeanalyzer._init_japplication(analysis_json_path_file.read_bytes())
+        except (OSError, ValidationError):
+            return None
+        if analysis_level == 2 and application.call_graph is None:
+            return None
+        return application
+
     def _init_codeanalyzer(self, analysis_level=1) -> JApplication:
         """Should initialize the Codeanalyzer.
 
@@ -190,8 +215,6 @@ class JCodeanalyzer(JavaAnalysisBackend):
             except Exception as e:
                 raise CodeanalyzerExecutionException(str(e)) from e
         else:
-            # Check if the code analyzer needs to be run
-            is_run_code_analyzer = False
             analysis_json_path_file = Path(self.analysis_json_path).joinpath("analysis.json")
             # If target file is provided, the input is merged into a single string and passed to codeanalyzer
             if self.target_files:
@@ -199,33 +222,33 @@ class JCodeanalyzer(JavaAnalysisBackend):
                 codeanalyzer_args = codeanalyzer_exec + shlex.split(
                     f"-i {Path(self.project_dir)} --analysis-level={analysis_level}" f" -o {self.analysis_json_path} -t {target_file_options}"
                 )
-                is_run_code_analyzer = True
             else:
-                if not self.check_exisiting_analysis_file_level(analysis_json_path_file, analysis_level) or self.eager_analysis:
-                    # If the analysis file does not exist, we'll run the analysis. Alternately, if the eager_analysis
-                    # flag is set, we'll run the analysis every time the object is created. This will happen regradless
-                    # of the existence of the analysis file.
-                    # Create the executable command for codeanalyzer.
-                    codeanalyzer_args = codeanalyzer_exec + shlex.split(f"-i {Path(self.project_dir)} --analysis-level={analysis_level} -o {self.analysis_json_path} -v")
-                    is_run_code_analyzer = True
-
-            if is_run_code_analyzer:
-                try:
-                    logger.info(f"Running codeanalyzer subprocess with args {codeanalyzer_args}")
-                    subprocess.run(
-                        codeanalyzer_args,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    if not analysis_json_path_file.exists():
-                        raise CodeanalyzerExecutionException("Codeanalyzer did not generate the analysis file.")
+                if not self.eager_analysis:
+                    # Reuse the analysis file of an earlier run if it is compatible. It is read and validated once,
+                    # and the validated application is what tells whether it is compatible.
+                    application = self._load_existing_analysis(analysis_json_path_file, analysis_level)
+                    if application is not None:
+                        return application
+                # If the analysis file does not exist, we'll run the analysis. Alternately, if the eager_analysis
+                # flag is set, we'll run the analysis every time the object is created. This will happen regradless
+                # of the existence of the analysis file.
+                # Create the executable command for codeanalyzer.
+                codeanalyzer_args = codeanalyzer_exec + shlex.split(f"-i {Path(self.project_dir)} --analysis-level={analysis_level} -o {self.analysis_json_path} -v")
+
+            try:
+                logger.info(f"Running codeanalyzer subprocess with args {codeanalyzer_args}")
+                subprocess.run(
+                    codeanalyzer_args,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                if not analysis_json_path_file.exists():
+                    raise CodeanalyzerExecutionException("Codeanalyzer did not generate the analysis file.")
 
-                except Exception as e:
-                    raise CodeanalyzerExecutionException(str(e)) from e
-            with open(analysis_json_path_file) as f:
-                data = json.load(f)
-                return self._init_japplication(json.dumps(data))
+            except Exception as e:
+                raise CodeanalyzerExecutionException(str(e)) from e
+            return self._init_japplication(analysis_json_path_file.read_bytes())
 
     def _codeanalyzer_single_file(self) -> JApplication:
         """Invokes codeanalyzer in a single file mode.
@@ -276,7 +299,9 @@ class JCodeanalyzer(JavaAnalysisBackend):
         Returns:
             list[JGraphEdges]: The system dependency graph.
         """
-        if self.application.system_dependency_graph is None or self.application.call_graph is None:
+        # Codeanalyzer never emits a separate system dependency graph and the call graph stands in for it, so only
+        # re-run the (call graph level) analysis when the call graph itself is missing.
+        if self.application.call_graph is None:
             self.application = self._init_codeanalyzer(analysis_level=2)
 
         logger.warning("System dependency graph is not yet implemented. Returning the call graph instead.")
@@ -932,7 +957,9 @@ class JCodeanalyzer(JavaAnalysisBackend):
         if method_name is None:
             filter_criteria = {node for node in self.call_graph.nodes if node[1] == qualified_class_name}
         else:
-            filter_criteria = {node for node in self.call_graph.nodes if tuple(node) == (method_name, qualified_class_name)}
+            # Nodes are keyed by (signature, class), so the method's node is named directly rather than searched
+            # for; edges() quietly skips it when the method is not in the call graph.
+            filter_criteria = {(method_name, qualified_class_name)}
 
         graph_edges: List[Tuple[JMethodDetail, JMethodDetail]] = list()
         for edge in self.call_graph.edges(nbunch=filter_criteria):
@@ -1080,6 +1107,27 @@ class JCodeanalyzer(JavaAnalysisBackend):
                     )
         return crud_delete_operations
 
+    def get_crud_operations_by_type(self) -> Dict[CRUDOperationType, List[Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]]]:
+        """Should return the per-type CRUD views, all built in one pass over the classes.
+
+        Returns:
+            Dict[CRUDOperationType, List[Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]]]: For each
+            operation type, the same list the matching ``get_all_<type>_operations`` method returns.
+        """
+        crud_operations_by_type = {operation_type: [] for operation_type in CRUDOperationType}
+        for class_name, class_details in self.get_all_classes().items():
+            for method_name, method_details in class_details.callable_declarations.items():
+                if len(method_details.crud_operations) > 0:
+                    for operation_type, crud_operations in crud_operations_by_type.items():
+                        crud_operations.append(
+                            {
+                                class_name: class_details,
+                                method_name: method_details,
+                                "crud_operations": [crud_op for crud_op in method_details.crud_operations if crud_op.operation_type == operation_type],
+                            }
+                        )
+        return crud_operations_by_type
+
     # Some APIs to process comments
     def get_comments_in_a_method(self, qualified_class_name: str, method_signature: str) -> List[JComment]:
         """Get all comments in a method.
@@ -1144,3 +1192,19 @@ class JCodeanalyzer(JavaAnalysisBackend):
                 docstrings[file_path] = javadoc_comments
 
         return docstrings
+
+    def get_all_comments_and_docstrings(self) -> Tuple[Dict[str, List[JComment]], Dict[str, List[JComment]]]:
+        """Get all comments and all docstrings in the Java application in a single pass.
+
+        Returns:
+            Tuple[Dict[str, List[JComment]], Dict[str, List[JComment]]]: The results of
+            :meth:`get_all_comments` and :meth:`get_all_docstrings`.
+        """
+        comments = {}
+        docstrings = {}
+        for file_path, compilation_unit in self.get_symbol_table().items():
+            comments[file_path] = compilation_unit.comments
+            javadoc_comments = [docstring for docstring in compilation_unit.comments if docstring.is_javadoc]
+            if javadoc_comments:
+                docstrings[file_path] = javadoc_comments
+        return comments, docstrings
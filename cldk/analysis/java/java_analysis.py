@@ -56,12 +56,32 @@ from cldk.analysis.commons.backend_config import CodeAnalyzerConfig, JavaBackend
 from cldk.analysis.commons.treesitter import TreesitterJava
 from cldk.models.java import JCallable
 from cldk.models.java import JApplication
+from cldk.models.java.enums import CRUDOperationType
 from cldk.models.java.models import JCRUDOperation, JComment, JCompilationUnit, JMethodDetail, JType, JField
 from cldk.analysis.java.codeanalyzer import JCodeanalyzer
 from cldk.analysis.java.neo4j import JNeo4jBackend
 from cldk.analysis.java.backend import JavaAnalysisBackend
 
 
+# Facade methods that only forward to the backend with the same name and arguments. They stay on
+# the class for their documentation, but each instance binds them straight to its backend so calls
+# skip the forwarding frame.
+_BACKEND_PASSTHROUGH = (
+    "get_all_crud_operations",
+    "get_all_create_operations",
+    "get_all_read_operations",
+    "get_all_update_operations",
+    "get_all_delete_operations",
+    "get_crud_operations_by_type",
+    "get_comments_in_a_method",
+    "get_comments_in_a_class",
+    "get_comment_in_file",
+    "get_all_comments",
+    "get_all_docstrings",
+    "get_all_comments_and_docstrings",
+)
+
+
 class JavaAnalysis:
     """Analysis facade for Java code.
 
@@ -177,6 +197,8 @@ class JavaAnalysis:
                 analysis_json_path=cache_path,
                 target_files=self.target_files,
             )
+        for name in _BACKEND_PASSTHROUGH:
+            setattr(self, name, getattr(self.backend, name))
 
     def get_imports(self) -> List[str]:
         """Return all import statements in the source code.
@@ -1149,6 +1171,24 @@ class JavaAnalysis:
         """
         return self.backend.get_all_delete_operations()
 
+    def get_crud_operations_by_type(self) -> Dict[CRUDOperationType, List[Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]]]:
+        """Return the Create, Read, Update and Delete views in one call.
+
+        Builds every per-type view in a single traversal of the classes,
+        instead of the four traversals that calling each
+        ``get_all_<type>_operations`` method separately costs.
+
+        Returns:
+            A dictionary mapping each :class:`~cldk.models.java.enums.CRUDOperationType`
+            to the list the matching ``get_all_<type>_operations`` method
+            returns (e.g. ``CRUDOperationType.READ`` to
+            :meth:`get_all_read_operations`).
+
+        See Also:
+            :meth:`get_all_crud_operations`: For all CRUD operations, unsplit.
+        """
+        return self.backend.get_crud_operations_by_type()
+
     # Some APIs to process comments
     def get_comments_in_a_method(self, qualified_class_name: str, method_signature: str) -> List[JComment]:
         """Return all comments contained within a specific method.
@@ -1240,3 +1280,21 @@ class JavaAnalysis:
             :meth:`get_all_comments`: For all comment types.
         """
         return self.backend.get_all_docstrings()
+
+    def get_all_comments_and_docstrings(self) -> Tuple[Dict[str, List[JComment]], Dict[str, List[JComment]]]:
+        """Return all comments and all Javadoc comments in one pass.
+
+        Equivalent to ``(get_all_comments(), get_all_docstrings())`` but
+        walks the analyzed files only once.
+
+        Returns:
+            A tuple ``(comments, docstrings)`` of dictionaries mapping file
+            paths to lists of :class:`~cldk.models.java.JComment` objects,
+            as returned by :meth:`get_all_comments` and
+            :meth:`get_all_docstrings` respectively.
+
+        See Also:
+            :meth:`get_all_comments`: For all comment types.
+            :meth:`get_all_docstrings`: For Javadoc comments only.
+        """
+        return self.backend.get_all_comments_and_docstrings()
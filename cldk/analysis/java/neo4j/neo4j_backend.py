@@ -697,6 +697,16 @@ class JNeo4jBackend(JavaAnalysisBackend):
     def get_all_delete_operations(self) -> List[Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]]:
         return self._crud(CRUDOperationType.DELETE)
 
+    def get_crud_operations_by_type(self) -> Dict[CRUDOperationType, List[Dict[str, Union[JType, JCallable, List[JCRUDOperation]]]]]:
+        rows_by_type = {op_type: [] for op_type in CRUDOperationType}
+        for class_name, class_details in self.get_all_classes().items():
+            for method_name, method_details in class_details.callable_declarations.items():
+                if method_details.crud_operations and len(method_details.crud_operations) > 0:
+                    for op_type, rows in rows_by_type.items():
+                        ops = [o for o in method_details.crud_operations if o.operation_type == op_type]
+                        rows.append({class_name: class_details, method_name: method_details, "crud_operations": ops})
+        return rows_by_type
+
     def get_comments_in_a_method(self, qualified_class_name: str, method_signature: str) -> List[JComment]:
         callable = self.get_method(qualified_class_name, method_signature)
         return callable.comments if callable is not None else []
@@ -721,3 +731,13 @@ class JNeo4jBackend(JavaAnalysisBackend):
             if javadoc_comments:
                 docstrings[file_path] = javadoc_comments
         return docstrings
+
+    def get_all_comments_and_docstrings(self) -> Tuple[Dict[str, List[JComment]], Dict[str, List[JComment]]]:
+        comments: Dict[str, List[JComment]] = {}
+        docstrings: Dict[str, List[JComment]] = {}
+        for file_path, compilation_unit in self.get_symbol_table().items():
+            comments[file_path] = compilation_unit.comments
+            javadoc_comments = [docstring for docstring in compilation_unit.comments if docstring.is_javadoc]
+            if javadoc_comments:
+                docstrings[file_path] = javadoc_comments
+        return comments, docstrings
@@ -30,7 +30,7 @@ by convention. Backend-specific lifecycle (caches, drivers) is intentionally not
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import networkx as nx
 
@@ -67,6 +67,10 @@ class PythonAnalysisBackend(ABC):
     def get_modules(self) -> List[PyModule]:
         """All modules."""
 
+    @abstractmethod
+    def iter_modules(self) -> Iterator[PyModule]:
+        """All modules, yielded one at a time as each is built."""
+
     @abstractmethod
     def get_python_module(self, file_path: str) -> PyModule | None:
         """The module for a file path."""
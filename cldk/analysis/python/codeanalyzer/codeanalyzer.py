@@ -50,6 +50,7 @@ See Also:
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Iterator, List, Tuple, Union
 
@@ -288,7 +289,15 @@ class PyCodeanalyzer(PythonAnalysisBackend):
             A list of :class:`~cldk.models.python.PyModule` objects,
             one for each analyzed Python file.
         """
-        return list(self.application.symbol_table.values())
+        return list(self.iter_modules())
+
+    def iter_modules(self) -> Iterator[PyModule]:
+        """Yield the analyzed modules one at a time.
+
+        Yields:
+            Each :class:`~cldk.models.python.PyModule` in the symbol table.
+        """
+        yield from self.application.symbol_table.values()
 
     def get_call_graph(self) -> nx.DiGraph:
         """Return the call graph as a NetworkX directed graph.
@@ -445,6 +454,16 @@ class PyCodeanalyzer(PythonAnalysisBackend):
             Module-level functions are included under the module name as
             the outer key, allowing unified access to all callables.
         """
+        return {scope: dict(methods) for scope, methods in self._methods_by_scope.items()}
+
+    @cached_property
+    def _methods_by_scope(self) -> Dict[str, Dict[str, PyCallable]]:
+        """The :meth:`get_all_methods_in_application` index, built once on first use.
+
+        The application is immutable after analysis, so :meth:`get_method` (and everything that
+        resolves through it, e.g. callers/callees) looks scopes up here instead of re-walking the
+        whole symbol table on every call.
+        """
         result: Dict[str, Dict[str, PyCallable]] = {}
         for module in self.application.symbol_table.values():
             for class_sig, cls in module.classes.items():
@@ -496,7 +515,7 @@ class PyCodeanalyzer(PythonAnalysisBackend):
             The :class:`~cldk.models.python.PyCallable` object,
             or ``None`` if not found.
         """
-        methods = self.get_all_methods_in_application().get(qualified_class_name, {})
+        methods = self._methods_by_scope.get(qualified_class_name, {})
         if qualified_method_name in methods:
             return methods[qualified_method_name]
         # Fallback: match by short name when only the simple name is given.
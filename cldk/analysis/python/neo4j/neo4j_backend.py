@@ -71,7 +71,7 @@ Everything else round-trips identically to ``PyCodeanalyzer``.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 import networkx as nx
 from codeanalyzer.schema import model_dump_json
@@ -184,6 +184,16 @@ class PyNeo4jBackend(PythonAnalysisBackend):
         )
         return [r["k"] for r in rows]
 
+    def invalidate_modules(self) -> None:
+        """Drop the cached module keys and call graph so they are re-read from the graph.
+
+        Both are loaded once and reused by every query. Call this after the graph has been
+        re-populated out of band (e.g. an editor re-emitting changed files) to pick up added or
+        removed modules.
+        """
+        self._modules = self._load_module_keys()
+        self._call_graph = None
+
     # =====================================================================================
     # Reconstruction helpers — fetch a node's children over Cypher, then assemble via R.
     # =====================================================================================
@@ -284,17 +294,20 @@ class PyNeo4jBackend(PythonAnalysisBackend):
         return PyApplication(symbol_table=self.get_symbol_table(), call_graph=self._call_edges())
 
     def get_symbol_table(self) -> Dict[str, PyModule]:
-        result: Dict[str, PyModule] = {}
+        # symbol_table keyed by file_path (== file_key)
+        return {mod.file_path: mod for mod in self.iter_modules()}
+
+    def get_modules(self) -> List[PyModule]:
+        return list(self.iter_modules())
+
+    def iter_modules(self) -> Iterator[PyModule]:
+        # Only the module rows are fetched up front; each module's N+1 reconstruction runs as it is
+        # yielded, so a caller that filters or stops early never rebuilds the rest.
         for r in self._run(
             "MATCH (:PyApplication {name: $app})-[:PY_HAS_MODULE]->(m:PyModule) RETURN properties(m) AS p",
             app=self.application_name,
         ):
-            mod = self._module_full(r["p"])
-            result[mod.file_path] = mod  # symbol_table keyed by file_path (== file_key)
-        return result
-
-    def get_modules(self) -> List[PyModule]:
-        return list(self.get_symbol_table().values())
+            yield self._module_full(r["p"])
 
     def get_python_module(self, file_path: str) -> PyModule | None:
         rows = self._run(
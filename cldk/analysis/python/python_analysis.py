@@ -47,7 +47,7 @@ See Also:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 
 import networkx as nx
 from tree_sitter import Tree
@@ -186,7 +186,7 @@ class PythonAnalysis:
             )
 
     # -----[ treesitter passthrough ]-----
-    def is_parsable(self, source_code: str) -> bool:
+    def is_parsable(self, source_code: str | bytes) -> bool:
         """Check if the given source code is valid Python syntax.
 
         Uses the Tree-sitter Python parser to attempt parsing the source code.
@@ -194,9 +194,9 @@ class PythonAnalysis:
         or for filtering out malformed code.
 
         Args:
-            source_code: A string containing Python source code to validate.
-                Can be a complete module, a function definition, or any
-                valid Python code fragment.
+            source_code: Python source code to validate, as a string or as
+                UTF-8 encoded bytes. Can be a complete module, a function
+                definition, or any valid Python code fragment.
 
         Returns:
             ``True`` if the source code parses without syntax errors,
@@ -208,7 +208,7 @@ class PythonAnalysis:
         """
         return self.treesitter_python.is_parsable(source_code)
 
-    def get_raw_ast(self, source_code: str) -> Tree:
+    def get_raw_ast(self, source_code: str | bytes) -> Tree:
         """Parse source code and return the Tree-sitter AST.
 
         Parses the provided Python source code using Tree-sitter and returns
@@ -216,7 +216,8 @@ class PythonAnalysis:
         extract syntactic information about the code structure.
 
         Args:
-            source_code: A string containing Python source code to parse.
+            source_code: Python source code to parse, as a string or as
+                UTF-8 encoded bytes (reused as-is, without re-encoding).
                 Should be syntactically valid Python code.
 
         Returns:
@@ -290,6 +291,23 @@ class PythonAnalysis:
         """
         return self.backend.get_modules()
 
+    def iter_modules(self) -> Iterator[PyModule]:
+        """Yield the analyzed modules one at a time.
+
+        A streaming counterpart of :meth:`get_modules`: each :class:`PyModule` is handed to the
+        caller as soon as the backend has built it, so a scan-and-filter consumer never has to hold
+        every module at once (on the Neo4j backend, modules that are never reached are never
+        reconstructed).
+
+        Yields:
+            :class:`~cldk.models.python.PyModule` objects, one for each Python file analyzed in the
+            project.
+
+        See Also:
+            :meth:`get_modules`: For the same modules as a list.
+        """
+        return self.backend.iter_modules()
+
     def get_python_file(self, qualified_class_name: str) -> str | None:
         """Return the file path containing a class with the given signature.
 
@@ -38,13 +38,21 @@ See Also:
     - :class:`~cldk.analysis.java.JavaAnalysis`: Analysis facade using these models.
     - :mod:`~cldk.models.java.enums`: Related enumeration types.
 """
-from typing import Any, Dict, List, Optional, Union
+import sys
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from cldk.models.java.enums import CRUDOperationType, CRUDQueryType
 
-_CALLABLES_LOOKUP_TABLE = dict()
+# Type names, modifiers and annotations repeat across the whole symbol table; interning them at
+# load time makes every repeat share one string object.
+_Interned = Annotated[str, AfterValidator(sys.intern)]
+
+# Every known callable, keyed by type declaration and then by signature. Nesting the two keys
+# spares each call-graph lookup from building (and hashing) a tuple key.
+_CALLABLES_LOOKUP_TABLE: Dict[str, Dict[str, "JCallable"]] = {}
 
 
 class JComment(BaseModel):
@@ -57,8 +65,12 @@ class JComment(BaseModel):
         start_column (int): The starting column of the comment in the source file.
         end_column (int): The ending column of the comment in the source file.
         is_javadoc (bool): A flag indicating whether the comment is a Javadoc comment.
+
+    Comments are frozen so that placeholder comments can be shared (see ``_EMPTY_COMMENT``).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     content: str | None = None
     start_line: int = -1
     end_line: int = -1
@@ -67,6 +79,19 @@ class JComment(BaseModel):
     is_javadoc: bool = False
 
 
+_EMPTY_COMMENT = JComment()
+"""The placeholder comment the analyzer emits for an uncommented element, shared by all of them."""
+
+
+def _share_empty_comment(comment: JComment | None) -> JComment | None:
+    """Collapse a placeholder comment onto the shared ``_EMPTY_COMMENT`` instance."""
+    return _EMPTY_COMMENT if comment == _EMPTY_COMMENT else comment
+
+
+# The type of the single ``comment`` carried by fields, call sites, variables and record components.
+_Comment = Annotated[JComment | None, AfterValidator(_share_empty_comment)]
+
+
 class JImport(BaseModel):
     """Represents a Java import declaration.
 
@@ -92,11 +117,11 @@ class JRecordComponent(BaseModel):
         modifiers (List[str]): The modifiers applied to the component.
     """
 
-    comment: JComment | None
+    comment: _Comment
     name: str
-    type: str
-    modifiers: List[str]
-    annotations: List[str]
+    type: _Interned
+    modifiers: List[_Interned]
+    annotations: List[_Interned]
     default_value: Union[str, None, Any] = None
     is_var_args: bool = False
 
@@ -117,13 +142,13 @@ class JField(BaseModel):
             variable name. None is used as the default for backwards compatibility.
     """
 
-    comment: JComment | None
-    type: str
+    comment: _Comment
+    type: _Interned
     start_line: int
     end_line: int
     variables: List[str]
-    modifiers: List[str]
-    annotations: List[str]
+    modifiers: List[_Interned]
+    annotations: List[_Interned]
     variable_initializers: Dict[str, str] | None = None
 
 
@@ -142,9 +167,9 @@ class JCallableParameter(BaseModel):
     """
 
     name: str | None
-    type: str
-    annotations: List[str]
-    modifiers: List[str]
+    type: _Interned
+    annotations: List[_Interned]
+    modifiers: List[_Interned]
     start_line: int
     end_line: int
     start_column: int
@@ -171,6 +196,8 @@ class JCRUDOperation(BaseModel):
         operation_type (JCRUDOperationType): The type of the operation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     line_number: int
     operation_type: CRUDOperationType | None
 
@@ -180,15 +207,41 @@ class JCRUDQuery(BaseModel):
 
     Attributes:
         line_number (int): The line number of the query.
-        query_arguments (List[str]): The arguments of the query.
+        query_arguments (Tuple[str, ...]): The arguments of the query.
         query_type (JCRUDQueryType): The type of the query.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     line_number: int
-    query_arguments: List[str] | None
+    query_arguments: Tuple[str, ...] | None
     query_type: CRUDQueryType | None
 
 
+# A CRUD operation or query is reported both on its call site and in its callable's list, so equal
+# ones are collapsed onto a single shared (frozen) instance as they are loaded.
+@lru_cache(maxsize=4096)
+def _crud_operation(line_number: int, operation_type: CRUDOperationType | None) -> JCRUDOperation:
+    return JCRUDOperation(line_number=line_number, operation_type=operation_type)
+
+
+@lru_cache(maxsize=4096)
+def _crud_query(line_number: int, query_arguments: Tuple[str, ...] | None, query_type: CRUDQueryType | None) -> JCRUDQuery:
+    return JCRUDQuery(line_number=line_number, query_arguments=query_arguments, query_type=query_type)
+
+
+def _share_crud_operation(operation: JCRUDOperation) -> JCRUDOperation:
+    return _crud_operation(operation.line_number, operation.operation_type)
+
+
+def _share_crud_query(query: JCRUDQuery) -> JCRUDQuery:
+    return _crud_query(query.line_number, query.query_arguments, query.query_type)
+
+
+_CRUDOperation = Annotated[JCRUDOperation, AfterValidator(_share_crud_operation)]
+_CRUDQuery = Annotated[JCRUDQuery, AfterValidator(_share_crud_query)]
+
+
 class JCallSite(BaseModel):
     """Represents a call site.
 
@@ -215,22 +268,22 @@ class JCallSite(BaseModel):
         end_column (int): The ending column of the call site.
     """
 
-    comment: JComment | None
-    method_name: str
+    comment: _Comment
+    method_name: _Interned
     receiver_expr: str = ""
-    receiver_type: str
-    argument_types: List[str]
+    receiver_type: _Interned
+    argument_types: List[_Interned]
     argument_expr: List[str]
-    return_type: str = ""
-    callee_signature: str = ""
+    return_type: _Interned = ""
+    callee_signature: _Interned = ""
     is_static_call: bool | None = None
     is_private: bool | None = None
     is_public: bool | None = None
     is_protected: bool | None = None
     is_unspecified: bool | None = None
     is_constructor_call: bool
-    crud_operation: JCRUDOperation | None
-    crud_query: JCRUDQuery | None
+    crud_operation: _CRUDOperation | None
+    crud_query: _CRUDQuery | None
     start_line: int
     start_column: int
     end_line: int
@@ -251,9 +304,9 @@ class JVariableDeclaration(BaseModel):
         end_column (int): The ending column of the declaration.
     """
 
-    comment: JComment | None
+    comment: _Comment
     name: str
-    type: str
+    type: _Interned
     initializer: str
     start_line: int
     start_column: int
@@ -282,7 +335,7 @@ class InitializationBlock(BaseModel):
 
     file_path: str
     comments: List[JComment]
-    annotations: List[str]
+    annotations: List[_Interned]
     thrown_exceptions: List[str]
     code: str
     start_line: int
@@ -327,9 +380,9 @@ class JCallable(BaseModel):
     is_implicit: bool
     is_constructor: bool
     comments: List[JComment]
-    annotations: List[str]
-    modifiers: List[str]
-    thrown_exceptions: List[str] = []
+    annotations: List[_Interned]
+    modifiers: List[_Interned]
+    thrown_exceptions: List[str] = Field(default_factory=list)
     declaration: str
     parameters: List[JCallableParameter]
     return_type: Optional[str] = None  # Pythonic way to denote a nullable field
@@ -342,8 +395,8 @@ class JCallable(BaseModel):
     call_sites: List[JCallSite]
     is_entrypoint: bool = False
     variable_declarations: List[JVariableDeclaration]
-    crud_operations: List[JCRUDOperation] | None
-    crud_queries: List[JCRUDQuery] | None
+    crud_operations: List[_CRUDOperation] | None
+    crud_queries: List[_CRUDQuery] | None
     cyclomatic_complexity: int | None
 
     def __hash__(self):
@@ -352,6 +405,10 @@ class JCallable(BaseModel):
         """
         return hash(self.declaration)
 
+    def __repr_args__(self):
+        # Show only the identity; the default repr renders the whole body, call sites and all.
+        yield "signature", self.signature
+
 
 class JType(BaseModel):
     """Represents a Java class or interface.
@@ -388,18 +445,18 @@ class JType(BaseModel):
     is_annotation_declaration: bool = False
     is_record_declaration: bool = False
     is_concrete_class: bool = False
-    comments: List[JComment] | None = []
-    extends_list: List[str] | None = []
-    implements_list: List[str] | None = []
-    modifiers: List[str] | None = []
-    annotations: List[str] | None = []
+    comments: List[JComment] | None = Field(default_factory=list)
+    extends_list: List[str] | None = Field(default_factory=list)
+    implements_list: List[str] | None = Field(default_factory=list)
+    modifiers: List[_Interned] | None = Field(default_factory=list)
+    annotations: List[_Interned] | None = Field(default_factory=list)
     parent_type: str
-    nested_type_declarations: List[str] | None = []
-    callable_declarations: Dict[str, JCallable] = {}
-    field_declarations: List[JField] = []
-    enum_constants: List[JEnumConstant] | None = []
-    record_components: List[JRecordComponent] | None = []
-    initialization_blocks: List[InitializationBlock] | None = []
+    nested_type_declarations: List[str] | None = Field(default_factory=list)
+    callable_declarations: Dict[str, JCallable] = Field(default_factory=dict)
+    field_declarations: List[JField] = Field(default_factory=list)
+    enum_constants: List[JEnumConstant] | None = Field(default_factory=list)
+    record_components: List[JRecordComponent] | None = Field(default_factory=list)
+    initialization_blocks: List[InitializationBlock] | None = Field(default_factory=list)
     is_entrypoint_class: bool = False
 
 
@@ -472,6 +529,10 @@ class JCompilationUnit(BaseModel):
 
         return data
 
+    def __repr_args__(self):
+        # Show only the identity; the default repr renders every type declared in the file.
+        yield "file_path", self.file_path
+
 
 class JMethodDetail(BaseModel):
     """Represents details about a method in a Java class.
@@ -491,7 +552,9 @@ class JMethodDetail(BaseModel):
         return f"JMethodDetail({self.method_declaration})"
 
     def __hash__(self):
-        return hash(tuple(self))
+        # Equal details share their class and declaration; hashing just those avoids walking (and
+        # hashing) every field on each lookup, which dominates call-graph traversal.
+        return hash((self.klass, self.method_declaration))
 
 
 class JGraphEdgesST(BaseModel):
@@ -514,6 +577,29 @@ class JGraphEdgesST(BaseModel):
     destination_kind: str | None = None
 
 
+@lru_cache(maxsize=65536)
+def _parameter_types(callable_declaration: str) -> Tuple[str, ...]:
+    """Return the parameter types listed in a declaration such as ``"put(java.lang.String, int)"``.
+
+    Call-graph edges repeat the same declarations many times over, so the result is cached.
+    """
+    start = callable_declaration.index("(") + 1
+    params = callable_declaration[start : callable_declaration.index(")", start)]
+    return tuple(params.split(",")) if params else ()
+
+
+def _placeholder_parameters(callable_declaration: str) -> List[JCallableParameter]:
+    """Return one unnamed, position-less parameter per type listed in ``callable_declaration``.
+
+    ``JCallableParameter`` is mutable, so every call gets its own parameters; only the parsed type
+    names are shared.
+    """
+    return [
+        JCallableParameter.model_construct(name=None, type=t, annotations=[], modifiers=[], start_column=-1, end_column=-1, start_line=-1, end_line=-1)
+        for t in _parameter_types(callable_declaration)
+    ]
+
+
 class JGraphEdges(BaseModel):
     source: JMethodDetail
     target: JMethodDetail
@@ -526,9 +612,12 @@ class JGraphEdges(BaseModel):
     @classmethod
     def validate_source(cls, value) -> JMethodDetail:
         _, type_declaration, signature = value["file_path"], value["type_declaration"], value["signature"]
-        j_callable: JCallable = _CALLABLES_LOOKUP_TABLE.get(
-            (type_declaration, signature),
-            JCallable(
+        callables = _CALLABLES_LOOKUP_TABLE.get(type_declaration)
+        j_callable: JCallable | None = callables.get(signature) if callables else None
+        if j_callable is None:
+            # Not in the symbol table (e.g. a library method): record an implicit placeholder once.
+            # Every value below is already of the field's type, so validation is skipped.
+            j_callable = JCallable.model_construct(
                 signature=signature,
                 is_implicit=True,
                 is_constructor="<init>" in value["callable_declaration"],
@@ -537,10 +626,7 @@ class JGraphEdges(BaseModel):
                 modifiers=[],
                 thrown_exceptions=[],
                 declaration="",
-                parameters=[
-                    JCallableParameter(name=None, type=t, annotations=[], modifiers=[], start_column=-1, end_column=-1, start_line=-1, end_line=-1)
-                    for t in value["callable_declaration"].split("(")[1].split(")")[0].split(",")
-                ],
+                parameters=_placeholder_parameters(value["callable_declaration"]),
                 return_type=None,
                 code="",
                 start_line=-1,
@@ -554,15 +640,14 @@ class JGraphEdges(BaseModel):
                 crud_operations=[],
                 crud_queries=[],
                 cyclomatic_complexity=0,
-            ),
-        )
-        _CALLABLES_LOOKUP_TABLE[(type_declaration, signature)] = j_callable
+            )
+            _CALLABLES_LOOKUP_TABLE.setdefault(type_declaration, {})[signature] = j_callable
         class_name = type_declaration
         method_decl = j_callable.declaration
-        return JMethodDetail(method_declaration=method_decl, klass=class_name, method=j_callable)
+        return JMethodDetail.model_construct(method_declaration=method_decl, klass=class_name, method=j_callable)
 
     def __hash__(self):
-        return hash(tuple(self))
+        return hash((self.source, self.target, self.type))
 
 
 class JApplication(BaseModel):
@@ -587,7 +672,8 @@ class JApplication(BaseModel):
         # Populate the lookup table for callables
         for _, j_compulation_unit in symbol_table.items():
             for type_declaration, jtype in j_compulation_unit.type_declarations.items():
+                callables = _CALLABLES_LOOKUP_TABLE.setdefault(type_declaration, {})
                 for __, j_callable in jtype.callable_declarations.items():
-                    _CALLABLES_LOOKUP_TABLE[(type_declaration, j_callable.signature)] = j_callable
+                    callables[j_callable.signature] = j_callable
 
         return symbol_table
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PyCallableOverview(BaseModel):
@@ -46,8 +46,13 @@ class PyCallableOverview(BaseModel):
         path: Project-relative path of the declaring module.
         start_line / end_line: The callable's line span.
         decorators: The decorator names applied to the callable.
+
+    Overviews are frozen: they are read-only snapshots of the analysis, so an accidental assignment
+    fails loudly instead of silently diverging from the backend.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     signature: str
     name: str
     class_signature: Optional[str] = None
@@ -22,15 +22,135 @@ imports, and inner classes.
 """
 
 import logging
-from copy import deepcopy
-from typing import Dict, List, Set
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, Iterator, List, Set, Tuple
+
+from tree_sitter import Node, Query, Tree
 
 from cldk.analysis.commons.treesitter import TreesitterJava
-from cldk.analysis.commons.treesitter.models import Captures
+from cldk.analysis.commons.treesitter.treesitter_java import LANGUAGE, PARSER, QUERY_MATCH_LIMIT
 
 log = logging.getLogger(__name__)
 
 
+def _query(source: str) -> Query:
+    """Compile a Java query with the shared match limit."""
+    query = LANGUAGE.query(source)
+    query.set_match_limit(QUERY_MATCH_LIMIT)
+    return query
+
+
+_MEMBER_DECLARATIONS: Query = _query("[(method_declaration) @method (constructor_declaration) @constructor (field_declaration) @field]")
+"""Methods, constructors and fields of a class, matched in a single pass."""
+
+_METHODS_AND_INVOCATIONS: Query = _query("[(method_declaration) @method_declaration (method_invocation name: (identifier) @invocation)]")
+"""Every method declaration, nested ones included, and the name of every method invocation, in a single pass."""
+
+_METHOD_NAMES: Query = _query("(method_declaration name: (identifier) @name)")
+"""The name of every method declaration, nested ones included."""
+
+_IMPORT_DECLARATIONS: Query = _query("((import_declaration) @imports)")
+"""Every import declaration."""
+
+_CLASS_DECLARATIONS: Query = _query("((class_declaration) @class_declaration)")
+"""Every class declaration, nested ones included."""
+
+_IDENTIFIER_TYPES = frozenset({"identifier", "type_identifier"})
+
+_PLAIN_IDENTIFIER_TYPES = frozenset({"identifier"})
+
+_TYPE_IDENTIFIER_TYPES = frozenset({"type_identifier"})
+
+
+def _captures(query: Query, node: Node) -> Dict[str, List[Node]]:
+    """Run a compiled query under ``node`` and return its captures by name, in source order."""
+    captures = query.captures(node)
+    if query.did_exceed_match_limit:
+        log.warning(f"Query exceeded the match limit of {QUERY_MATCH_LIMIT}; some captures may be missing.")
+    return {name: sorted(nodes, key=lambda n: n.start_byte) for name, nodes in captures.items()}
+
+
+def _parse(code: bytes) -> Tree:
+    """Parse UTF-8 encoded Java source."""
+    return PARSER.parse(code)
+
+
+def _splice_out(code: bytes, nodes: Iterable[Node]) -> bytes:
+    """Drop the source spans of ``nodes`` (parsed from ``code``) in one pass, by byte offset."""
+    kept: List[bytes] = []
+    position = 0
+    for start, end in sorted((node.start_byte, node.end_byte) for node in nodes):
+        if end <= position:  # Nested inside a span that is already dropped.
+            continue
+        kept.append(code[position:start])
+        position = max(position, end)
+    kept.append(code[position:])
+    return b"".join(kept)
+
+
+def _build_call_graph(methods: List[Tuple[str, Node]], invocations: List[Node]) -> Dict[str, Set[str]]:
+    """Map each declared method to the declared methods it calls.
+
+    Both lists come from one query over the class, in source order, so a single merge assigns every invocation to the
+    declarations enclosing it. An invocation counts for every enclosing method, not just the innermost one: a method
+    wrapping an anonymous class calls whatever the inner methods call. Overloads share one name and all their calls.
+    """
+    call_graph: Dict[str, Set[str]] = {name: set() for name, _ in methods}
+    enclosing: List[Tuple[int, str]] = []  # (end_byte, name) of the declarations open at the current position.
+    pending: Deque[Tuple[str, Node]] = deque(methods)
+    for invocation in invocations:
+        position = invocation.start_byte
+        while pending and pending[0][1].start_byte < position:
+            name, declaration = pending.popleft()
+            while enclosing and enclosing[-1][0] <= declaration.start_byte:
+                enclosing.pop()
+            enclosing.append((declaration.end_byte, name))
+        while enclosing and enclosing[-1][0] <= position:
+            enclosing.pop()
+        callee = _decode_ident(invocation)
+        if callee in call_graph:
+            for _, caller in enclosing:
+                call_graph[caller].add(callee)
+    return call_graph
+
+
+def _decode_ident(node: Node) -> str:
+    """Decode an identifier node's text, interned so repeated names share one string."""
+    return sys.intern(node.text.decode("utf-8"))
+
+
+def _iter_identifiers(node: Node, types: frozenset = _IDENTIFIER_TYPES, skip_inner_classes: bool = False) -> Iterator[str]:
+    """Yield the text of every node of the given ``types`` under ``node``, in source order, from one cursor walk.
+
+    With ``skip_inner_classes``, classes declared in a class body below ``node`` are not descended into.
+    """
+    cursor = node.walk()
+    while True:
+        current = cursor.node
+        if current.type in types:
+            yield _decode_ident(current)
+        inner_class = skip_inner_classes and current.type == "class_declaration" and cursor.depth > 0 and current.parent.type == "class_body"
+        if not inner_class and cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+
+
+def _identifiers(node: Node, types: frozenset = _IDENTIFIER_TYPES, skip_inner_classes: bool = False) -> Set[str]:
+    """Collect the distinct identifiers ``_iter_identifiers`` yields."""
+    return set(_iter_identifiers(node, types=types, skip_inner_classes=skip_inner_classes))
+
+
+def _sanitize_one(source_code: str, focal_method: str) -> str:
+    """Sanitize one class around one focal method; the unit of work for ``TreesitterSanitizer.sanitize_many``."""
+    return TreesitterSanitizer(source_code).sanitize_focal_class(focal_method)
+
+
 class TreesitterSanitizer:
     """Sanitize Java source code using tree-sitter queries.
 
@@ -46,8 +166,11 @@ class TreesitterSanitizer:
             source_code (str): The full Java source code to sanitize.
         """
         self.source_code = source_code
-        self.sanitized_code = deepcopy(self.source_code)
+        self.sanitized_code = self.source_code
         self.__javasitter = TreesitterJava()
+        # Each pruning step hands its output to the next, and several steps re-read the original source, so keep
+        # the last few trees around rather than re-parsing the same text.
+        self.__parse = lru_cache(maxsize=8)(_parse)
 
     def keep_only_focal_method_and_its_callees(self, focal_method: str) -> str:
         """Remove all methods except the focal method and its callees.
@@ -65,12 +188,7 @@ class TreesitterSanitizer:
             >>> 'drop' in out
             False
         """
-        method_declaration: Captures = self.__javasitter.frame_query_and_capture_output(query="((method_declaration) " "@method_declaration)", code_to_process=self.sanitized_code)
-        declared_methods = {self.__javasitter.get_method_name_from_declaration(capture.node.text.decode()): capture.node.text.decode() for capture in method_declaration}
-        unused_methods: Dict = self._unused_methods(focal_method, declared_methods)
-        for _, method_body in unused_methods.items():
-            self.sanitized_code = self.sanitized_code.replace(method_body, "")
-        return self.__javasitter.make_pruned_code_prettier(self.sanitized_code)
+        return self.__javasitter.make_pruned_code_prettier(self._remove_unused_methods_raw(focal_method).decode("utf-8"))
 
     def remove_unused_imports(self, sanitized_code: str) -> str:
         """Remove imports not referenced in the class body.
@@ -94,43 +212,7 @@ class TreesitterSanitizer:
             >>> TreesitterSanitizer(src).remove_unused_imports(src)
             ''
         """
-        pruned_source_code: str = deepcopy(sanitized_code)
-        import_declarations: Captures = self.__javasitter.frame_query_and_capture_output(query="((import_declaration) @imports)", code_to_process=self.source_code)
-
-        unused_imports: Set = set()
-        ids_and_typeids: Set = set()
-        class_bodies: Captures = self.__javasitter.frame_query_and_capture_output(query="((class_declaration) @class_declaration)", code_to_process=self.source_code)
-        for class_body in class_bodies:
-            all_type_identifiers_in_class: Captures = self.__javasitter.frame_query_and_capture_output(
-                query="((type_identifier) @type_id)",
-                code_to_process=class_body.node.text.decode(),
-            )
-            all_other_identifiers_in_class: Captures = self.__javasitter.frame_query_and_capture_output(
-                query="((identifier) @other_id)",
-                code_to_process=class_body.node.text.decode(),
-            )
-            ids_and_typeids.update({type_id.node.text.decode() for type_id in all_type_identifiers_in_class})
-            ids_and_typeids.update({other_id.node.text.decode() for other_id in all_other_identifiers_in_class})
-
-        for import_declaration in import_declarations:
-            wildcard_import: Captures = self.__javasitter.frame_query_and_capture_output(query="((asterisk) @wildcard)", code_to_process=import_declaration.node.text.decode())
-            if len(wildcard_import) > 0:
-                continue
-
-            import_statement: Captures = self.__javasitter.frame_query_and_capture_output(
-                query="((scoped_identifier) @scoped_identifier)", code_to_process=import_declaration.node.text.decode()
-            )
-            try:
-                import_str = import_statement.captures[0].node.text.decode()
-            except IndexError:
-                continue
-            if import_str.split(".")[-1] not in ids_and_typeids:
-                unused_imports.add(import_declaration.node.text.decode())
-
-        for unused_import in unused_imports:
-            pruned_source_code = pruned_source_code.replace(unused_import, "")
-
-        return self.__javasitter.make_pruned_code_prettier(pruned_source_code)
+        return self.__javasitter.make_pruned_code_prettier(self._remove_unused_imports_raw(sanitized_code.encode("utf-8")).decode("utf-8"))
 
     def remove_unused_fields(self, sanitized_code: str) -> str:
         """Remove fields not referenced in any method or constructor.
@@ -150,44 +232,7 @@ class TreesitterSanitizer:
             >>> 'int x;' in out
             False
         """
-        pruned_source_code: str = deepcopy(sanitized_code)
-        unused_fields: List[Captures.Capture] = list()
-        field_declarations: Captures = self.__javasitter.frame_query_and_capture_output(query="((field_declaration) @field_declaration)", code_to_process=pruned_source_code)
-        method_declaration: Captures = self.__javasitter.frame_query_and_capture_output(query="((method_declaration) @method_declaration)", code_to_process=pruned_source_code)
-        constructor_declaration: Captures = self.__javasitter.frame_query_and_capture_output(
-            query="((constructor_declaration) @constructor_declaration)", code_to_process=pruned_source_code
-        )
-        all_used_identifiers = set()
-        for method in method_declaration:
-            all_used_identifiers.update(
-                {
-                    capture.node.text.decode()
-                    for capture in self.__javasitter.frame_query_and_capture_output(query="((identifier) @identifier)", code_to_process=method.node.text.decode())
-                }
-            )
-
-        for constructor in constructor_declaration:
-            all_used_identifiers.update(
-                {
-                    capture.node.text.decode()
-                    for capture in self.__javasitter.frame_query_and_capture_output(query="((identifier) @identifier)", code_to_process=constructor.node.text.decode())
-                }
-            )
-
-        used_fields = [capture for capture in field_declarations]
-
-        for field in used_fields:
-            field_identifiers = {
-                capture.node.text.decode()
-                for capture in self.__javasitter.frame_query_and_capture_output(query="((identifier) @identifier)", code_to_process=field.node.text.decode())
-            }
-            if not field_identifiers.intersection(all_used_identifiers):
-                unused_fields.append(field)
-
-        for unused_field in unused_fields:
-            pruned_source_code = pruned_source_code.replace(unused_field.node.text.decode(), "")
-
-        return self.__javasitter.make_pruned_code_prettier(pruned_source_code)
+        return self.__javasitter.make_pruned_code_prettier(self._remove_unused_fields_raw(sanitized_code.encode("utf-8")).decode("utf-8"))
 
     def remove_unused_classes(self, sanitized_code: str) -> str:
         """Remove unused inner classes.
@@ -207,90 +252,146 @@ class TreesitterSanitizer:
             >>> 'class B' in out
             False
         """
-        focal_class = self.__javasitter.frame_query_and_capture_output(query="(class_declaration name: (identifier) @name)", code_to_process=self.source_code)
+        return self.__javasitter.make_pruned_code_prettier(self._remove_unused_classes_raw(sanitized_code.encode("utf-8")).decode("utf-8"))
+
+    def _remove_unused_methods_raw(self, focal_method: str) -> bytes:
+        """Remove all methods except the focal method and its callees, without prettifying."""
+        sanitized_code = self.sanitized_code.encode("utf-8")
+        captures = _captures(_METHODS_AND_INVOCATIONS, self.__parse(sanitized_code).root_node)
+        method_declaration = captures.get("method_declaration", [])
+        method_names = [_decode_ident(node.child_by_field_name("name")) for node in method_declaration]
+        declared_methods = dict(zip(method_names, method_declaration))
+        call_graph = _build_call_graph(list(zip(method_names, method_declaration)), captures.get("invocation", []))
+        unused_methods: Dict = self._unused_methods(focal_method, declared_methods, call_graph)
+        sanitized_code = _splice_out(sanitized_code, [node for name, node in zip(method_names, method_declaration) if name in unused_methods])
+        self.sanitized_code = sanitized_code.decode("utf-8")
+        return sanitized_code
+
+    def _remove_unused_imports_raw(self, sanitized_code: bytes) -> bytes:
+        """Remove unused imports, without prettifying."""
+        source_tree = self.__parse(sanitized_code)
+        import_declarations = _captures(_IMPORT_DECLARATIONS, source_tree.root_node).get("imports", [])
+
+        unused_imports: List[Node] = list()
+        ids_and_typeids: Set = set()
+        # Nested classes lie inside their outer class, so walking the outermost ones covers every class body.
+        outer_class_end = -1
+        for class_body in _captures(_CLASS_DECLARATIONS, source_tree.root_node).get("class_declaration", []):
+            if class_body.start_byte < outer_class_end:
+                continue
+            outer_class_end = class_body.end_byte
+            ids_and_typeids.update(_iter_identifiers(class_body))
+
+        for import_declaration in import_declarations:
+            # A wildcard import's asterisk, like its full name, is a direct child of the declaration; the
+            # scoped_identifiers nested in the full name are only its prefixes.
+            children = import_declaration.named_children
+            if any(child.type == "asterisk" for child in children):
+                continue
+            import_statement = next((child for child in children if child.type == "scoped_identifier"), None)
+            if import_statement is None:
+                continue
+            import_str = import_statement.text.decode("utf-8")
+            if import_str.split(".")[-1] not in ids_and_typeids:
+                unused_imports.append(import_declaration)
+
+        sanitized_code = _splice_out(sanitized_code, unused_imports)
+
+        return sanitized_code
+
+    def _remove_unused_fields_raw(self, sanitized_code: bytes) -> bytes:
+        """Remove unused fields, without prettifying."""
+        unused_fields: List[Node] = list()
+        members = _captures(_MEMBER_DECLARATIONS, self.__parse(sanitized_code).root_node)
+        all_used_identifiers = set()
+        for member in members.get("method", []) + members.get("constructor", []):
+            all_used_identifiers.update(_iter_identifiers(member, types=_PLAIN_IDENTIFIER_TYPES))
+
+        for field in members.get("field", []):
+            # Stop walking the declaration at its first identifier that is used.
+            if not any(identifier in all_used_identifiers for identifier in _iter_identifiers(field, types=_PLAIN_IDENTIFIER_TYPES)):
+                unused_fields.append(field)
+
+        sanitized_code = _splice_out(sanitized_code, unused_fields)
+
+        return sanitized_code
+
+    def _remove_unused_classes_raw(self, sanitized_code: bytes) -> bytes:
+        """Remove unused inner classes, without prettifying."""
+        focal_class = _captures(_CLASS_DECLARATIONS, self.__parse(self.source_code.encode("utf-8")).root_node).get("class_declaration", [])
 
         try:
             # We use [0] because there may be several nested classes,
             # we'll consider the outermost class as the focal class.
-            focal_class_name = focal_class[0].node.text.decode()
+            focal_class_name = _decode_ident(focal_class[0].child_by_field_name("name"))
         except Exception:
-            return ""
-
-        pruned_source_code = deepcopy(sanitized_code)
+            return b""
 
         # Find the first class and we'll continue to operate on the inner classes.
-        inner_class_declarations: Captures = self.__javasitter.frame_query_and_capture_output("((class_declaration) @class_declaration)", pruned_source_code)
+        class_declarations = _captures(_CLASS_DECLARATIONS, self.__parse(sanitized_code).root_node).get("class_declaration", [])
 
         # Store a dictionary of all the inner classes.
         all_classes = dict()
-        for capture in inner_class_declarations:
-            inner_class = self.__javasitter.frame_query_and_capture_output(query="(class_declaration name: (identifier) @name)", code_to_process=capture.node.text.decode())
-            all_classes[inner_class[0].node.text.decode()] = capture.node.text.decode()
-
-        unused_classes: dict = deepcopy(all_classes)
+        for node in class_declarations:
+            all_classes[_decode_ident(node.child_by_field_name("name"))] = node
 
-        to_process = {focal_class_name}
+        unused_classes: dict = dict(all_classes)
 
-        processed_so_far: Set = set()
+        # A FIFO worklist, plus every class ever put on it so each one is visited once.
+        to_process: Deque[str] = deque([focal_class_name])
+        queued: Set[str] = {focal_class_name}
 
         while to_process:
-            current_class_name = to_process.pop()
-            current_class_body = unused_classes.pop(current_class_name)
-            current_class_without_inner_class = current_class_body
-            processed_so_far.add(current_class_name)
+            current_class_name = to_process.popleft()
+            current_class = unused_classes.pop(current_class_name)
 
-            # Remove the body of inner classes from the current outer class.
-            inner_class_declarations: Captures = self.__javasitter.frame_query_and_capture_output("(class_body (class_declaration) @class_declaration)", current_class_body)
-            for capture in inner_class_declarations:
-                current_class_without_inner_class = current_class_without_inner_class.replace(capture.node.text.decode(), "")
+            # Find all the type_references in the current class, leaving out the bodies of its inner classes.
+            type_references: Set[str] = _identifiers(current_class, types=_TYPE_IDENTIFIER_TYPES, skip_inner_classes=True)
+            for type_reference in sorted(type_references):
+                if type_reference in all_classes and type_reference not in queued:
+                    queued.add(type_reference)
+                    to_process.append(type_reference)
 
-            # Find all the type_references in the current class.
-            type_references: Set[str] = self.__javasitter.get_all_type_invocations(current_class_without_inner_class)
-            to_process.update({type_reference for type_reference in type_references if type_reference in all_classes and type_reference not in processed_so_far})
+        sanitized_code = _splice_out(sanitized_code, [node for node in class_declarations if _decode_ident(node.child_by_field_name("name")) in unused_classes])
 
-        for _, unused_class_body in unused_classes.items():
-            pruned_source_code = pruned_source_code.replace(unused_class_body, "")
-
-        return self.__javasitter.make_pruned_code_prettier(pruned_source_code)
+        return sanitized_code
 
-    def _unused_methods(self, focal_method: str, declared_methods: Dict) -> Dict:
+    def _unused_methods(self, focal_method: str, declared_methods: Dict, call_graph: Dict[str, Set[str]]) -> Dict:
         """Compute methods unused given a focal method.
 
         Args:
             focal_method (str): Starting method name; all others are candidates for removal.
-            declared_methods (dict): Map of method name to its body text.
+            declared_methods (dict): Map of method name to its declaration.
+            call_graph (dict[str, set[str]]): Map of method name to the declared methods it calls.
 
         Returns:
-            dict[str, str]: Unused methods with their bodies.
+            dict: Unused methods with their declarations.
 
         Notes:
             - Traverse the call graph from the focal method using in-class call
               targets; anything unreached is unused.
         """
 
-        unused_methods = deepcopy(declared_methods)  # A deep copy of unused methods.
+        if focal_method not in declared_methods:
+            return dict(declared_methods)
 
-        # A stack to hold the methods to process.
-        to_process = [focal_method]  # Remove this element from unused methods and put it
-        # in the to_process stack.
+        unused_methods = dict(declared_methods)  # A copy of the declared methods; reachable ones are popped below.
 
-        # The set below holds all processed methods bodies. This helps avoid recursive and cyclical calls.
-        processed_so_far: Set = set()
+        # A FIFO worklist of methods to process, plus every method ever put on it. Checking the latter before
+        # enqueuing keeps a method with many callers from being queued more than once, and handles recursive and
+        # cyclical calls.
+        to_process: Deque[str] = deque([focal_method])
+        queued: Set[str] = {focal_method}
 
         while to_process:
-            # Remove the current method from the to process stack
-            current_method_name = to_process.pop()
-
-            # This method has been processed already, so we'll skip it.
-            if current_method_name in processed_so_far:
-                continue
-            current_method_body = unused_methods.pop(current_method_name)
-            processed_so_far.add(current_method_name)
-            # Below, we find all method invocations that are made inside current_method_body that are also declared in
-            # the class. We will get back an empty set if there are no more.
-            all_invoked_methods = self.__javasitter.get_call_targets(current_method_body, declared_methods=declared_methods)
-            # Add all the methods invoked in a call to to_process iff those methods are declared in the class.
-            to_process.extend([invoked_method_name for invoked_method_name in all_invoked_methods if invoked_method_name not in processed_so_far])
+            current_method_name = to_process.popleft()
+            unused_methods.pop(current_method_name)
+            # Add the methods invoked inside the current method that are also declared in the class; the call graph
+            # holds an empty set when there are none.
+            for invoked_method_name in sorted(call_graph[current_method_name]):
+                if invoked_method_name not in queued:
+                    queued.add(invoked_method_name)
+                    to_process.append(invoked_method_name)
 
         assert len(unused_methods) < len(declared_methods), "At least one of the declared methods (the focal method) must have be used?"
 
@@ -303,7 +404,8 @@ class TreesitterSanitizer:
             focal_method (str): The focal method declaration text or name.
 
         Returns:
-            str: Pruned source code with only relevant members retained.
+            str: Pruned source code with only relevant members retained, or an empty string when the class does not
+            declare the focal method.
 
         Examples:
             >>> src = 'class A { void keep(){} void drop(){} }'
@@ -313,19 +415,56 @@ class TreesitterSanitizer:
 
         focal_method_name = self.__javasitter.get_method_name_from_declaration(focal_method)
 
+        # Without the focal method there is nothing to keep; skip the pruning steps altogether.
+        method_names = _captures(_METHOD_NAMES, self.__parse(self.sanitized_code.encode("utf-8")).root_node).get("name", [])
+        if focal_method_name not in {_decode_ident(node) for node in method_names}:
+            return ""
+
         # Remove block comments
         sanitized_code = self.__javasitter.remove_all_comments(self.sanitized_code)
 
         # The source code after removing
-        sanitized_code = self.keep_only_focal_method_and_its_callees(focal_method_name)
+        sanitized_code = self._remove_unused_methods_raw(focal_method_name)
 
         # Focal method was found in the class, remove unused fields, imports, and classes.
-        sanitized_code = self.remove_unused_fields(sanitized_code)
+        sanitized_code = self._remove_unused_fields_raw(sanitized_code)
 
         # Focal method was found in the class, remove unused fields, imports, and classes.
-        sanitized_code = self.remove_unused_imports(sanitized_code)
+        sanitized_code = self._remove_unused_imports_raw(sanitized_code)
 
         # Focal method was found in the class, remove unused fields, imports, and classes.
-        sanitized_code = self.remove_unused_classes(sanitized_code)
+        sanitized_code = self._remove_unused_classes_raw(sanitized_code)
 
-        return sanitized_code
+        # The steps above leave blank runs where declarations were cut out; tidy the result once, at the end.
+        return self.__javasitter.make_pruned_code_prettier(sanitized_code.decode("utf-8"))
+
+    @classmethod
+    def sanitize_many(cls, sources_and_methods: Iterable[Tuple[str, str]], max_workers: int | None = None) -> List[str]:
+        """Sanitize many classes, each around its own focal method, across processes.
+
+        Each class is independent and the work is CPU-bound parsing, so the
+        pairs are spread over a process pool; only the source strings cross
+        the process boundary.
+
+        Args:
+            sources_and_methods (Iterable[tuple[str, str]]): ``(source_code, focal_method)`` pairs.
+            max_workers (int | None): Worker processes; defaults to the CPU count.
+                With a single worker everything runs in this process.
+
+        Returns:
+            list[str]: The sanitized sources, in input order.
+
+        Examples:
+            >>> src = 'class A { void keep(){} void drop(){} }'
+            >>> TreesitterSanitizer.sanitize_many([(src, 'void keep(){}')], max_workers=1)
+            ['class A { void keep(){}  }']
+        """
+        pairs = list(sources_and_methods)
+        if not pairs:
+            return []
+        sources, methods = zip(*pairs)
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1:
+            return list(map(_sanitize_one, sources, methods))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_sanitize_one, sources, methods, chunksize=8))
@@ -0,0 +1,143 @@
+################################################################################
+# Copyright IBM Corporation 2026
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+"""Java test fixtures.
+
+Building a ``JCodeanalyzer`` over the daytrader ``analysis.json`` (validating the application and
+deriving its call graph) dominates the cost of the Java backend tests, and the input never
+changes. ``parsed_japplication`` validates it once per session and ``base_code_analyzer`` wraps it
+in a single analyzer; ``code_analyzer`` hands each test its own shallow copy, so attribute changes
+made by one test never leak into the next.
+"""
+
+import copy
+from subprocess import CompletedProcess
+from unittest.mock import patch
+
+import pytest
+
+from cldk.analysis import AnalysisLevel
+from cldk.analysis.java.codeanalyzer import JCodeanalyzer
+from cldk.models.java.models import JApplication
+
+CODEANALYZER_RUN = "cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run"
+"""Where tests patch ``subprocess.run`` so that codeanalyzer itself never runs."""
+
+
+def make_analyzer(application: JApplication, project_dir, analysis_level: str = AnalysisLevel.call_graph) -> JCodeanalyzer:
+    """Wrap an already validated application in a ``JCodeanalyzer``.
+
+    Sets the attributes ``JCodeanalyzer.__init__`` would, but takes the application as given
+    instead of running codeanalyzer and validating its output again.
+    """
+    analyzer = object.__new__(JCodeanalyzer)
+    analyzer.project_dir = project_dir
+    analyzer.source_code = None
+    analyzer.analysis_json_path = None
+    analyzer.eager_analysis = False
+    analyzer.analysis_level = analysis_level
+    analyzer.target_files = None
+    analyzer.application = application
+    analyzer.call_graph = analyzer._generate_call_graph(using_symbol_table=False) if analysis_level == AnalysisLevel.call_graph else None
+    return analyzer
+
+
+@pytest.fixture(scope="session")
+def parsed_japplication(analysis_json) -> JApplication:
+    """The daytrader analysis, validated into a ``JApplication`` once per session."""
+    return JApplication.model_validate_json(analysis_json)
+
+
+@pytest.fixture(scope="session")
+def base_code_analyzer(test_fixture, parsed_japplication) -> JCodeanalyzer:
+    """A call-graph level ``JCodeanalyzer`` over ``parsed_japplication``, built once per session.
+
+    Its call graph is derived here, once, and shared by every test. Tests should not use it
+    directly; ask for ``code_analyzer`` instead.
+    """
+    return make_analyzer(parsed_japplication, project_dir=test_fixture)
+
+
+@pytest.fixture
+def codeanalyzer_run(analysis_json):
+    """Patch ``subprocess.run`` for one test, so that codeanalyzer never runs.
+
+    Every run outputs the daytrader ``analysis.json``. The mock is yielded, so a test can check
+    whether and how codeanalyzer would have been called. Tests that run the real codeanalyzer
+    simply do not ask for it.
+    """
+    with patch(CODEANALYZER_RUN, return_value=CompletedProcess(args=[], returncode=0, stdout=analysis_json)) as run_mock:
+        yield run_mock
+
+
+@pytest.fixture
+def code_analyzer(base_code_analyzer, codeanalyzer_run) -> JCodeanalyzer:
+    """A per-test copy of ``base_code_analyzer``.
+
+    The analyzer and its application are copied shallowly, so a test may reassign any of their
+    attributes (``application``, ``analysis_level``, ``source_code``, ``target_files``, ...). A
+    re-analysis the test triggers reads the same ``analysis.json`` through ``codeanalyzer_run``.
+    """
+    analyzer = copy.copy(base_code_analyzer)
+    analyzer.application = base_code_analyzer.application.model_copy()
+    return analyzer
+
+
+@pytest.fixture(scope="session")
+def symbol_table_analyzer(test_fixture) -> JCodeanalyzer:
+    """A symbol-table ``JCodeanalyzer`` over the daytrader project, analyzed once per session.
+
+    Unlike ``base_code_analyzer``, this one runs the real codeanalyzer (through the pipe, without an
+    ``analysis.json``). The entrypoint queries only read the application, so their tests share it.
+    """
+    return JCodeanalyzer(
+        project_dir=test_fixture,
+        source_code=None,
+        analysis_json_path=None,
+        analysis_level=AnalysisLevel.symbol_table,
+        eager_analysis=False,
+        target_files=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def crud_analyzer_pbw(test_fixture_pbw) -> JCodeanalyzer:
+    """A symbol-table ``JCodeanalyzer`` over the plantsbywebsphere project, analyzed once per session.
+
+    This one runs the real codeanalyzer (``eager_analysis`` forces a fresh ``analysis.json`` under
+    ``build/``). The CRUD queries only read the application, so every CRUD test shares it.
+    """
+    return JCodeanalyzer(
+        project_dir=test_fixture_pbw,
+        source_code=None,
+        analysis_json_path=test_fixture_pbw / "build",
+        analysis_level=AnalysisLevel.symbol_table,
+        eager_analysis=True,
+        target_files=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def crud_analyzer_daytrader(test_fixture) -> JCodeanalyzer:
+    """Like ``crud_analyzer_pbw``, over the daytrader project."""
+    return JCodeanalyzer(
+        project_dir=test_fixture,
+        source_code=None,
+        analysis_json_path=test_fixture / "build",
+        analysis_level=AnalysisLevel.symbol_table,
+        eager_analysis=True,
+        target_files=None,
+    )
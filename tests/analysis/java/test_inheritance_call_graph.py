@@ -10,6 +10,7 @@ from cldk import CLDK
 from cldk.analysis import AnalysisLevel
 
 
+@pytest.mark.jvm
 class TestInheritanceCallGraphIntegration:
     """Test suite for inheritance support in call graph generation."""
 
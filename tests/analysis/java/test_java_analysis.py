@@ -20,8 +20,9 @@ Java Tests
 
 import os
 import json
+from subprocess import CompletedProcess
 from typing import Dict, List, Set, Tuple
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from tree_sitter import Tree
 import pytest
@@ -30,6 +31,7 @@ import networkx as nx
 from cldk import CLDK
 from cldk.analysis import AnalysisLevel
 from cldk.analysis.java import JavaAnalysis
+from cldk.models.java.enums import CRUDOperationType
 from cldk.models.java.models import JCallable, JCallableParameter, JComment, JCompilationUnit, JField, JMethodDetail, JApplication, JType
 from pathlib import Path
 import tempfile as _tempfile
@@ -38,6 +40,8 @@ from cldk.analysis.commons.backend_config import CodeAnalyzerConfig
 _CACHE_DIR = _tempfile.mkdtemp()
 _BK = CodeAnalyzerConfig(cache_dir=_CACHE_DIR)
 
+CODEANALYZER_RUN = "cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run"
+
 
 def _write_java_output(payload):
     """subprocess.run side effect: write analysis.json into the -o dir (caching on by default)."""
@@ -47,7 +51,7 @@ def _write_java_output(payload):
             out = Path(cmd[cmd.index("-o") + 1])
             out.mkdir(parents=True, exist_ok=True)
             (out / "analysis.json").write_text(payload, encoding="utf-8")
-        return MagicMock(stdout=payload, returncode=0)
+        return CompletedProcess(cmd, 0, stdout=payload)
 
     return _run
 
@@ -56,7 +60,7 @@ def test_get_symbol_table_is_not_null(test_fixture, analysis_json):
     """Should return a symbol table that is not null"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
 
         # Initialize the CLDK object with the project directory, language, and analysis_backend
@@ -69,6 +73,7 @@ def test_get_symbol_table_is_not_null(test_fixture, analysis_json):
         )
         assert analysis.get_symbol_table() is not None
 
+@pytest.mark.jvm
 def test_get_symbol_table_source_code(java_code):
     """Should return a symbol table for source analysis with expected class/method count"""
 
@@ -91,7 +96,7 @@ def test_get_imports(test_fixture, analysis_json):
     """Should return NotImplemented for get_imports()"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -112,7 +117,7 @@ def test_get_variables(test_fixture, analysis_json):
     """Should return NotImplemented for get_variables()"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -133,7 +138,7 @@ def test_get_service_entry_point_classes(test_fixture, analysis_json):
     """Should return NotImplemented for get_service_entry_point_classes()"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -154,7 +159,7 @@ def test_get_service_entry_point_methods(test_fixture, analysis_json):
     """Should return NotImplemented for get_service_entry_point_methods()"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -175,7 +180,7 @@ def test_get_application_view(test_fixture, analysis_json):
     """Should return the application view"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -204,7 +209,7 @@ def test_get_symbol_table(test_fixture, analysis_json):
     """Should return the symbol table"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -226,7 +231,7 @@ def test_get_compilation_units(test_fixture, analysis_json):
     """Should return the compilation units"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -245,7 +250,7 @@ def test_get_class_hierarchy(test_fixture, analysis_json):
     """Should return the class hierarchy"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -266,7 +271,7 @@ def test_is_parsable(test_fixture, analysis_json):
     """Should be parsable"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -289,7 +294,7 @@ def test_get_raw_ast(test_fixture, analysis_json):
     """Should return the raw AST"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -315,7 +320,7 @@ def test_get_call_graph(test_fixture, analysis_json):
     """Should return the Call Graph"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -338,7 +343,7 @@ def test_get_call_graph_json(test_fixture, analysis_json):
     """Should return the Call Graph as JSON"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -363,7 +368,7 @@ def test_get_callers(test_fixture, analysis_json):
     """Should return the callers"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -407,7 +412,7 @@ def test_get_callees(test_fixture, analysis_json):
     """Should return the callees"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -456,7 +461,7 @@ def test_get_methods(test_fixture, analysis_json):
     """Should return the methods"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -479,7 +484,7 @@ def test_get_classes(test_fixture, analysis_json):
     """Should return the classes"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -502,7 +507,7 @@ def test_get_classes_by_criteria(test_fixture, analysis_json):
     """Should return the classes by criteria"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -540,7 +545,7 @@ def test_get_class(test_fixture, analysis_json):
     """Should return a single class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -560,7 +565,7 @@ def test_get_method(test_fixture, analysis_json):
     """Should return a single method"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -581,7 +586,7 @@ def test_get_method_parameters(test_fixture, analysis_json):
     """Should return a method parameters"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -607,7 +612,7 @@ def test_get_java_file(test_fixture, analysis_json):
     """Should return the java file and compilation unit"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -635,7 +640,7 @@ def test_get_methods_in_class(test_fixture, analysis_json):
     """Should return the methods in a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -659,7 +664,7 @@ def test_get_fields(test_fixture, analysis_json):
     """Should return the fields for a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -681,6 +686,7 @@ def test_get_fields(test_fixture, analysis_json):
             assert field.variable_initializers is None
 
 
+@pytest.mark.jvm
 def test_get_fields_variable_initializers(java_code):
     """Should return per-variable initializer text for fields"""
 
@@ -702,7 +708,7 @@ def test_get_nested_classes(test_fixture, analysis_json):
     """Should return the nested classes for a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -725,7 +731,7 @@ def test_get_sub_classes(test_fixture, analysis_json):
     """Should return the subclasses for a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -755,7 +761,7 @@ def test_get_extended_classes(test_fixture, analysis_json):
     """Should return the extended classes for a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -785,7 +791,7 @@ def test_get_implemented_interfaces(test_fixture, analysis_json):
     """Should return the implemented interfaces classes for a class"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -815,7 +821,7 @@ def test_get_class_call_graph(test_fixture, analysis_json):
     """Should return the class call graph"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -847,7 +853,7 @@ def test_get_entry_point_classes(test_fixture, analysis_json):
     """Should return the entry point classes"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -870,7 +876,7 @@ def test_get_entry_point_methods(test_fixture, analysis_json):
     """Should return the entry point methods"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -895,7 +901,7 @@ def test_remove_all_comments(test_fixture, analysis_json):
     """remove all comments"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -921,7 +927,7 @@ def test_get_methods_with_annotations(test_fixture, analysis_json):
     """Should return methods with annotations"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -958,7 +964,7 @@ public class TradeDirectDBUtilsTest {
 """
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -978,7 +984,7 @@ def test_get_calling_lines(test_fixture, analysis_json):
     """Should return calling lines"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1007,7 +1013,7 @@ def test_get_call_targets(test_fixture, analysis_json):
     """Should return calling targets"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1035,7 +1041,7 @@ def test_get_all_comments(test_fixture, analysis_json):
     """Should return all comments"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1064,7 +1070,7 @@ def test_get_all_docstrings(test_fixture, analysis_json):
     """Should return all docstrings"""
 
     # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1088,6 +1094,49 @@ def test_get_all_docstrings(test_fixture, analysis_json):
                     print(f"Docstring: {doc.content}")
 
 
+def test_get_all_comments_and_docstrings(test_fixture, analysis_json):
+    """Should return the same comments and docstrings as the two separate calls"""
+
+    # Patch subprocess so that it does not run codeanalyzer
+    with patch(CODEANALYZER_RUN) as run_mock:
+        run_mock.side_effect = _write_java_output(analysis_json)
+        java_analysis = JavaAnalysis(
+            project_dir=test_fixture,
+            source_code=None,
+            backend=_BK,
+            analysis_level=AnalysisLevel.call_graph,
+            target_files=None,
+            eager_analysis=False,
+        )
+
+        all_comments, all_docstrings = java_analysis.get_all_comments_and_docstrings()
+        assert all_comments == java_analysis.get_all_comments()
+        assert all_docstrings == java_analysis.get_all_docstrings()
+
+
+def test_get_crud_operations_by_type(test_fixture, analysis_json):
+    """Should return the same per-type CRUD views as the four separate calls"""
+
+    # Patch subprocess so that it does not run codeanalyzer
+    with patch(CODEANALYZER_RUN) as run_mock:
+        run_mock.side_effect = _write_java_output(analysis_json)
+        java_analysis = JavaAnalysis(
+            project_dir=test_fixture,
+            source_code=None,
+            backend=_BK,
+            analysis_level=AnalysisLevel.call_graph,
+            target_files=None,
+            eager_analysis=False,
+        )
+
+        by_type = java_analysis.get_crud_operations_by_type()
+        assert set(by_type) == set(CRUDOperationType)
+        assert by_type[CRUDOperationType.CREATE] == java_analysis.get_all_create_operations()
+        assert by_type[CRUDOperationType.READ] == java_analysis.get_all_read_operations()
+        assert by_type[CRUDOperationType.UPDATE] == java_analysis.get_all_update_operations()
+        assert by_type[CRUDOperationType.DELETE] == java_analysis.get_all_delete_operations()
+
+
 # --------------------------------------------------------------------------------------------
 # Miss-path tests (#248): lookups must return None/[] honestly on a miss, never crash.
 # --------------------------------------------------------------------------------------------
@@ -1096,7 +1145,7 @@ def test_get_all_docstrings(test_fixture, analysis_json):
 def test_get_class_miss_returns_none(test_fixture, analysis_json):
     """A qualified class name that doesn't exist should return None, not fall off the end."""
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1113,7 +1162,7 @@ def test_get_class_miss_returns_none(test_fixture, analysis_json):
 def test_get_method_miss_returns_none(test_fixture, analysis_json):
     """A method signature that doesn't exist should return None, not fall off the end."""
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1133,7 +1182,7 @@ def test_get_method_miss_returns_none(test_fixture, analysis_json):
 def test_get_java_file_miss_returns_none(test_fixture, analysis_json):
     """A qualified class name that doesn't exist should return None, not fall off the end."""
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1153,7 +1202,7 @@ def test_get_method_parameters_miss_returns_empty_list(test_fixture, analysis_js
     Before the fix, this raised: AttributeError: 'NoneType' object has no attribute 'parameters'.
     """
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1171,7 +1220,7 @@ def test_get_method_parameters_miss_returns_empty_list(test_fixture, analysis_js
 def test_get_comments_in_a_method_miss_returns_empty_list(test_fixture, analysis_json):
     """get_comments_in_a_method must not crash with AttributeError when the method is missing."""
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1192,7 +1241,7 @@ def test_call_graph_target_method_miss_mid_construction_no_crash(test_fixture, a
     reached through the public get_all_callers(using_symbol_table=True) path.
     """
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1219,7 +1268,7 @@ def test_call_graph_source_method_miss_mid_construction_no_crash(test_fixture, a
     simulating a symbol table that disagrees with itself mid-construction.
     """
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
@@ -1258,7 +1307,7 @@ def test_get_comments_in_a_class_miss_returns_empty_list(test_fixture, analysis_
     Before the fix, this raised: AttributeError: 'NoneType' object has no attribute 'comments'.
     """
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
+    with patch(CODEANALYZER_RUN) as run_mock:
         run_mock.side_effect = _write_java_output(analysis_json)
         java_analysis = JavaAnalysis(
             project_dir=test_fixture,
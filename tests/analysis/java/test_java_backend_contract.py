@@ -51,3 +51,12 @@ def test_contract_covers_every_method_the_facade_delegates():
     contract = {n for n in dir(JavaAnalysisBackend) if not n.startswith("__")}
     missing = delegated - contract
     assert not missing, f"facade delegates to backend methods absent from the contract: {sorted(missing)}"
+
+
+def test_facade_passthroughs_are_documented_contract_methods():
+    """Methods the facade binds straight to its backend still exist (and are documented) on both sides."""
+    from cldk.analysis.java.java_analysis import _BACKEND_PASSTHROUGH, JavaAnalysis
+
+    for name in _BACKEND_PASSTHROUGH:
+        assert getattr(JavaAnalysis, name).__doc__, name
+        assert name in JavaAnalysisBackend.__abstractmethods__, name
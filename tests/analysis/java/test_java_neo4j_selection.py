@@ -54,6 +54,8 @@ def test_no_config_uses_in_process_backend(tmp_path):
         neo4j_cls.assert_not_called()
         assert analysis.backend is backend_cls.return_value
         assert isinstance(analysis.backend_config, CodeAnalyzerConfig)
+        # Pure passthroughs are bound straight to the backend, skipping the facade's wrapper.
+        assert analysis.get_all_comments is backend_cls.return_value.get_all_comments
 
 
 def test_missing_neo4j_driver_raises_helpful_error():
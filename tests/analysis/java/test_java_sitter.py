@@ -423,3 +423,25 @@ def test_make_pruned_code_prettier(test_fixture):
     assert isinstance(pretty_code, str)
     assert len(pretty_code) > 0
     assert "/*" not in pretty_code
+
+
+def test_frame_query_and_capture_output_reuses_compiled_query():
+    """compile each distinct query string once"""
+    from cldk.analysis.commons.treesitter.treesitter_java import _compile_query
+
+    java_sitter = TreesitterJava()
+    query = "(method_invocation name: (identifier) @method_name)"
+
+    first = java_sitter.frame_query_and_capture_output(query, "class A { void f() { g(); } }")
+    second = java_sitter.frame_query_and_capture_output(query, "class B { void f() { h(); } }")
+
+    assert first[0].node.text.decode() == "g"
+    assert second[0].node.text.decode() == "h"
+    assert _compile_query(query) is _compile_query(query)
+
+
+def test_compiled_queries_carry_the_match_limit():
+    """bound in-progress matches on every compiled query"""
+    from cldk.analysis.commons.treesitter.treesitter_java import QUERY_MATCH_LIMIT, _compile_query
+
+    assert _compile_query("(identifier) @identifier").match_limit == QUERY_MATCH_LIMIT
@@ -20,9 +20,8 @@ Test Cases for JCodeanalyzer
 
 import os
 import json
-from typing import Dict, List, Tuple
-from unittest.mock import patch, MagicMock
 import networkx as nx
+import pytest
 
 from cldk.analysis import AnalysisLevel
 from cldk.analysis.java.codeanalyzer import JCodeanalyzer
@@ -30,6 +29,19 @@ from cldk.models.java.models import JApplication, JCRUDOperation, JType, JCallab
 from cldk.models.java import JGraphEdges
 
 
+# Daytrader classes and method signatures that several tests query.
+TRADE_DIRECT = "com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect"
+LOG = "com.ibm.websphere.samples.daytrader.util.Log"
+ACCOUNT_DATA_BEAN = "com.ibm.websphere.samples.daytrader.entities.AccountDataBean"
+LOG_SIG = "log(java.lang.String)"
+PRINT_COLLECTION_SIG = "printCollection(java.lang.String, java.util.Collection)"
+PUBLISH_QUOTE_PRICE_CHANGE_SIG = "publishQuotePriceChange(com.ibm.websphere.samples.daytrader.entities.QuoteDataBean, java.math.BigDecimal, java.math.BigDecimal, double)"
+CREATE_HOLDING_SIG = "createHolding(java.sql.Connection, int, java.lang.String, double, java.math.BigDecimal)"
+
+# Every value a JCRUDOperation.operation_type may take.
+CRUD_OPERATION_TYPES = frozenset(("CREATE", "READ", "UPDATE", "DELETE"))
+
+
 def _build_analysis_json_payload(version: str, imports: list[dict[str, object] | str], include_call_graph: bool = False) -> dict:
     payload = {
         "symbol_table": {
@@ -49,73 +61,51 @@ def _build_analysis_json_payload(version: str, imports: list[dict[str, object] |
     return payload
 
 
-def test_init_japplication(test_fixture, codeanalyzer_backend_path, analysis_json):
+def test_init_japplication(code_analyzer, analysis_json):
     """Should return the initialized JApplication"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        app = code_analyzer._init_japplication(analysis_json)
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-
-def test_init_codeanalyzer_no_json_path(test_fixture, analysis_json):
-    """Should initialize the codeanalyzer without a json path"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files="a.java b.java",
-        )
-        app = code_analyzer.application
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-
-def test_init_codeanalyzer_with_json_path(test_fixture, analysis_json, analysis_json_fixture):
-    """Should initialize the codeanalyzer with a json path"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=analysis_json_fixture,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        app = code_analyzer.application
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-        # test for eager_analysis:
-        code_analyzer.eager_analysis = True
-        app = code_analyzer._init_codeanalyzer(1)
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-        # Test with target files
-        code_analyzer.target_files = "a.java b.java"
-        app = code_analyzer._init_codeanalyzer(1)
-        assert app is not None
-        assert isinstance(app, JApplication)
+    app = code_analyzer._init_japplication(analysis_json)
+    assert app is not None
+    assert isinstance(app, JApplication)
+
+
+@pytest.mark.parametrize("with_json_path", [False, True], ids=["pipe", "json-path"])
+@pytest.mark.parametrize("target_files", [None, "a.java b.java"], ids=["all-files", "target-files"])
+@pytest.mark.parametrize("analysis_level", [AnalysisLevel.symbol_table, AnalysisLevel.call_graph], ids=["symbol-table", "call-graph"])
+def test_init_codeanalyzer(test_fixture, analysis_json_fixture, codeanalyzer_run, with_json_path, target_files, analysis_level):
+    """Should initialize the codeanalyzer for every combination of json path, target files and analysis level"""
+
+    code_analyzer = JCodeanalyzer(
+        project_dir=test_fixture,
+        source_code=None,
+        analysis_json_path=analysis_json_fixture if with_json_path else None,
+        analysis_level=analysis_level,
+        eager_analysis=False,
+        target_files=target_files,
+    )
+    assert isinstance(code_analyzer.application, JApplication)
+    if analysis_level == AnalysisLevel.call_graph:
+        assert isinstance(code_analyzer.call_graph, nx.DiGraph)
+    else:
+        assert code_analyzer.call_graph is None
+
+    # The cached analysis is reused unless target files ask for a fresh one; codeanalyzer runs once otherwise.
+    if with_json_path and target_files is None:
+        assert not codeanalyzer_run.called
+    else:
+        assert codeanalyzer_run.call_count == 1
+        assert ("-t" in codeanalyzer_run.call_args.args[0]) == (target_files is not None)
+
+
+def test_init_codeanalyzer_eager(code_analyzer, analysis_json_fixture, codeanalyzer_run):
+    """Should rerun the codeanalyzer on every initialization when eager_analysis is set"""
+
+    code_analyzer.analysis_json_path = analysis_json_fixture
+    code_analyzer.eager_analysis = True
+    app = code_analyzer._init_codeanalyzer(1)
+    assert isinstance(app, JApplication)
+    assert codeanalyzer_run.call_count == 1
+    assert "-o" in codeanalyzer_run.call_args.args[0]
 
 
 def test_init_japplication_supports_legacy_import_schema() -> None:
@@ -147,6 +137,13 @@ def test_init_japplication_supports_structured_import_schema() -> None:
     assert compilation_unit.import_declarations[0].is_wildcard is False
 
 
+def test_init_japplication_accepts_raw_json_bytes() -> None:
+    """Should build the same application from the raw bytes of a cached analysis file."""
+    payload = json.dumps(_build_analysis_json_payload(version="2.3.7", imports=["java.util.List"]))
+    from_bytes = JCodeanalyzer._init_japplication(payload.encode("utf-8"))
+    assert from_bytes == JCodeanalyzer._init_japplication(payload)
+
+
 def test_check_existing_analysis_file_level_accepts_legacy_import_schema(tmp_path) -> None:
     """Should accept cached analysis files that use the legacy imports schema."""
     analysis_file = tmp_path / "analysis.json"
@@ -170,7 +167,23 @@ def test_check_existing_analysis_file_level_rejects_invalid_json(tmp_path) -> No
     assert not JCodeanalyzer.check_exisiting_analysis_file_level(analysis_file, analysis_level=1)
 
 
-def test_init_codeanalyzer_reuses_legacy_cache_when_compatible(test_fixture, codeanalyzer_backend_path, tmp_path) -> None:
+def test_load_existing_analysis_matches_the_compatibility_check(tmp_path) -> None:
+    """Should load a cached analysis only when the compatibility check would accept it."""
+    analysis_file = tmp_path / "analysis.json"
+    assert JCodeanalyzer._load_existing_analysis(analysis_file, analysis_level=1) is None
+
+    analysis_file.write_text("{not-valid-json", encoding="utf-8")
+    assert JCodeanalyzer._load_existing_analysis(analysis_file, analysis_level=1) is None
+
+    analysis_file.write_text(json.dumps(_build_analysis_json_payload(version="2.3.7", imports=["java.util.List"])), encoding="utf-8")
+    assert isinstance(JCodeanalyzer._load_existing_analysis(analysis_file, analysis_level=1), JApplication)
+    assert JCodeanalyzer._load_existing_analysis(analysis_file, analysis_level=2) is None
+
+    analysis_file.write_text(json.dumps(_build_analysis_json_payload(version="2.3.7", imports=["java.util.List"], include_call_graph=True)), encoding="utf-8")
+    assert isinstance(JCodeanalyzer._load_existing_analysis(analysis_file, analysis_level=2), JApplication)
+
+
+def test_init_codeanalyzer_reuses_legacy_cache_when_compatible(test_fixture, codeanalyzer_backend_path, tmp_path, codeanalyzer_run) -> None:
     """Should reuse cached analysis.json when legacy imports are still compatible."""
     analysis_json_dir = tmp_path / "analysis-cache"
     analysis_json_dir.mkdir()
@@ -178,16 +191,15 @@ def test_init_codeanalyzer_reuses_legacy_cache_when_compatible(test_fixture, cod
     legacy_payload = _build_analysis_json_payload(version="2.3.6", imports=["java.util.List"])
     analysis_json_file.write_text(json.dumps(legacy_payload), encoding="utf-8")
 
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=analysis_json_dir,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-    assert not run_mock.called
+    code_analyzer = JCodeanalyzer(
+        project_dir=test_fixture,
+        source_code=None,
+        analysis_json_path=analysis_json_dir,
+        analysis_level=AnalysisLevel.symbol_table,
+        eager_analysis=False,
+        target_files=None,
+    )
+    assert not codeanalyzer_run.called
     compilation_unit = next(iter(code_analyzer.application.symbol_table.values()))
     assert compilation_unit.imports == ["java.util.List"]
     assert isinstance(compilation_unit.import_declarations[0], JImport)
@@ -196,649 +208,327 @@ def test_init_codeanalyzer_reuses_legacy_cache_when_compatible(test_fixture, cod
     assert compilation_unit.import_declarations[0].is_wildcard is False
 
 
-def test_generate_call_graph(test_fixture, analysis_json):
+def test_generate_call_graph(code_analyzer):
     """Should generate a graph"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # generate with symbol table
-        cg = code_analyzer._generate_call_graph(True)
-        assert isinstance(cg, nx.DiGraph)
-
-        # generate without symbol table
-        cg = code_analyzer._generate_call_graph(False)
-        assert isinstance(cg, nx.DiGraph)
-        edge = list(cg.edges(data=True))[0]
-        assert edge[2]["type"] == "CALL_DEP" or edge[2]["type"] == "CONTROL_DEP"
-        assert isinstance(int(edge[2]["weight"]), int)
-        assert isinstance(edge[2]["calling_lines"], list)
-        # assert all(isinstance(line, str) for line in edge[2]["calling_lines"])
-
-
-def test_codeanalyzer_single_file(test_fixture, analysis_json):
+    # generate with symbol table
+    cg = code_analyzer._generate_call_graph(True)
+    assert isinstance(cg, nx.DiGraph)
+
+    # generate without symbol table
+    cg = code_analyzer._generate_call_graph(False)
+    assert isinstance(cg, nx.DiGraph)
+    edge = list(cg.edges(data=True))[0]
+    assert edge[2]["type"] == "CALL_DEP" or edge[2]["type"] == "CONTROL_DEP"
+    assert isinstance(int(edge[2]["weight"]), int)
+    assert isinstance(edge[2]["calling_lines"], list)
+    # assert all(isinstance(line, str) for line in edge[2]["calling_lines"])
+
+
+def test_codeanalyzer_single_file(test_fixture, codeanalyzer_run):
     """Should process a single file"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code="dummy.java",
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        app = code_analyzer._codeanalyzer_single_file()
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-
-def test_get_application(test_fixture, analysis_json):
+    code_analyzer = JCodeanalyzer(
+        project_dir=test_fixture,
+        source_code="dummy.java",
+        analysis_json_path=None,
+        analysis_level=AnalysisLevel.symbol_table,
+        eager_analysis=False,
+        target_files=None,
+    )
+    app = code_analyzer._codeanalyzer_single_file()
+    assert app is not None
+    assert isinstance(app, JApplication)
+
+
+def test_get_application(code_analyzer):
     """Should return the application"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        code_analyzer.application = None
-        app = code_analyzer._get_application()
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-
-def test_get_symbol_table(test_fixture, analysis_json):
+    code_analyzer.application = None
+    app = code_analyzer._get_application()
+    assert app is not None
+    assert isinstance(app, JApplication)
+
+
+def test_get_symbol_table(code_analyzer):
     """Should return the symbol table"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        code_analyzer.application = None
-        symbol_table = code_analyzer.get_symbol_table()
-        assert symbol_table is not None
-        assert isinstance(symbol_table, Dict)
-        for _, comp_unit in symbol_table.items():
-            assert isinstance(comp_unit, JCompilationUnit)
-
-
-def test_get_application_view(test_fixture, analysis_json):
+    code_analyzer.application = None
+    symbol_table = code_analyzer.get_symbol_table()
+    assert symbol_table is not None
+    assert isinstance(symbol_table, dict)
+    assert all(isinstance(comp_unit, JCompilationUnit) for comp_unit in symbol_table.values())
+
+
+def test_get_application_view(code_analyzer):
     """Should return an application view"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        code_analyzer.application = None
-        app = code_analyzer.get_application_view()
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-        # Test with source file
-        code_analyzer.source_code = "./tests/resources/java/application/sample.daytrader8-1.2/src/main/java/com/ibm/websphere/samples/daytrader/web/websocket/ActionMessage.java"
-        app = code_analyzer.get_application_view()
-        assert app is not None
-        assert isinstance(app, JApplication)
-
-
-def test_get_system_dependency_graph(test_fixture, analysis_json):
+    code_analyzer.application = None
+    app = code_analyzer.get_application_view()
+    assert app is not None
+    assert isinstance(app, JApplication)
+
+    # Test with source file
+    code_analyzer.source_code = "./tests/resources/java/application/sample.daytrader8-1.2/src/main/java/com/ibm/websphere/samples/daytrader/web/websocket/ActionMessage.java"
+    app = code_analyzer.get_application_view()
+    assert app is not None
+    assert isinstance(app, JApplication)
+
+
+def test_get_system_dependency_graph(code_analyzer):
     """Should return an system dependency graph"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-        code_analyzer.application.system_dependency_graph = None
-        graph = code_analyzer.get_system_dependency_graph()
-        assert graph is not None
-        assert isinstance(graph, list)
-        assert len(graph) > 0
-        assert isinstance(graph[0], JGraphEdges)
-
-
-def test_get_call_graph(test_fixture, analysis_json):
+    code_analyzer.application.system_dependency_graph = None
+    graph = code_analyzer.get_system_dependency_graph()
+    assert graph is not None
+    assert isinstance(graph, list)
+    assert len(graph) > 0
+    assert isinstance(graph[0], JGraphEdges)
+
+
+def test_call_graph_reuses_the_loaded_analysis(code_analyzer, codeanalyzer_run):
+    """Should derive the call graph from the loaded analysis without running codeanalyzer again"""
+    application = code_analyzer.application
+
+    assert code_analyzer.get_system_dependency_graph() is application.call_graph
+    assert isinstance(code_analyzer._generate_call_graph(using_symbol_table=False), nx.DiGraph)
+    assert code_analyzer.application is application
+    assert not codeanalyzer_run.called
+
+
+def test_get_call_graph(code_analyzer):
     """Should return a call graph"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-        graph = code_analyzer.get_call_graph()
-        assert graph is not None
-        assert isinstance(graph, nx.DiGraph)
-
-        # test for symbol table
-        code_analyzer.analysis_level = AnalysisLevel.symbol_table
-        graph = code_analyzer.get_call_graph()
-        assert graph is not None
-        assert isinstance(graph, nx.DiGraph)
-
-
-def test_get_call_graph_json(test_fixture, analysis_json):
+    graph = code_analyzer.get_call_graph()
+    assert graph is not None
+    assert isinstance(graph, nx.DiGraph)
+
+    # test for symbol table
+    code_analyzer.analysis_level = AnalysisLevel.symbol_table
+    graph = code_analyzer.get_call_graph()
+    assert graph is not None
+    assert isinstance(graph, nx.DiGraph)
+
+
+def test_get_call_graph_json(code_analyzer):
     """Should return the call graph as json"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-        graph_json = code_analyzer.get_call_graph_json()
-        assert graph_json is not None
-        assert isinstance(graph_json, str)
-        graph = json.loads(graph_json)
-        assert graph is not None
-        assert isinstance(graph, list)
-
-
-def test_get_all_callers(test_fixture, analysis_json):
+    graph_json = code_analyzer.get_call_graph_json()
+    assert graph_json is not None
+    assert isinstance(graph_json, str)
+    graph = json.loads(graph_json)
+    assert graph is not None
+    assert isinstance(graph, list)
+
+
+def test_get_all_callers(code_analyzer):
     """Should return all of the callers"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Call without using symbol table
-        all_callers = code_analyzer.get_all_callers("com.ibm.websphere.samples.daytrader.util.Log", "log(java.lang.String)", False)
-        assert all_callers is not None
-        assert isinstance(all_callers, Dict)
-        assert len(all_callers) > 0
-        assert "caller_details" in all_callers
-        assert len(all_callers["caller_details"]) == 18
-        for method in all_callers["caller_details"]:
-            assert isinstance(method["caller_method"], JMethodDetail)
-
-        # Call using symbol table
-
-        # TODO: This currently doesn't work. Code has bad call as seen in this error message:
-        # TypeError: TreesitterJava.get_calling_lines() missing 1 required positional argument: 'is_target_method_a_constructor'
-        all_callers = code_analyzer.get_all_callers("com.ibm.websphere.samples.daytrader.util.Log", "log(java.lang.String)", True)
-        assert all_callers is not None
-        assert isinstance(all_callers, Dict)
-        assert "caller_details" in all_callers
-
-
-def test_get_all_callees(test_fixture, analysis_json):
+    # Call without using symbol table
+    all_callers = code_analyzer.get_all_callers(LOG, LOG_SIG, False)
+    assert all_callers is not None
+    assert isinstance(all_callers, dict)
+    assert len(all_callers) > 0
+    assert "caller_details" in all_callers
+    assert len(all_callers["caller_details"]) == 18
+    for method in all_callers["caller_details"]:
+        assert isinstance(method["caller_method"], JMethodDetail)
+
+    # Call using symbol table
+
+    # TODO: This currently doesn't work. Code has bad call as seen in this error message:
+    # TypeError: TreesitterJava.get_calling_lines() missing 1 required positional argument: 'is_target_method_a_constructor'
+    all_callers = code_analyzer.get_all_callers(LOG, LOG_SIG, True)
+    assert all_callers is not None
+    assert isinstance(all_callers, dict)
+    assert "caller_details" in all_callers
+
+
+def test_get_all_callees(code_analyzer):
     """Should return all of the callees"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Call without using symbol table
-        all_callees = code_analyzer.get_all_callees("com.ibm.websphere.samples.daytrader.util.Log", "printCollection(java.lang.String, java.util.Collection)", False)
-        assert all_callees is not None
-        assert isinstance(all_callees, Dict)
-        assert "callee_details" in all_callees
-        assert len(all_callees["callee_details"]) == 2
-
-        # Call using the symbol table
-
-        # TODO: Throws the following exception
-        # TypeError: TreesitterJava.get_calling_lines() missing 1 required positional argument: 'is_target_method_a_constructor'
-        all_callees = code_analyzer.get_all_callees("com.ibm.websphere.samples.daytrader.util.Log", "printCollection(java.lang.String, java.util.Collection)", True)
-        assert all_callees is not None
-        assert isinstance(all_callees, Dict)
-        assert "callee_details" in all_callees
-        assert len(all_callees["callee_details"]) == 2
-
-
-def test_get_all_classes(test_fixture, analysis_json):
+    # Call without using symbol table
+    all_callees = code_analyzer.get_all_callees(LOG, PRINT_COLLECTION_SIG, False)
+    assert all_callees is not None
+    assert isinstance(all_callees, dict)
+    assert "callee_details" in all_callees
+    assert len(all_callees["callee_details"]) == 2
+
+    # Call using the symbol table
+
+    # TODO: Throws the following exception
+    # TypeError: TreesitterJava.get_calling_lines() missing 1 required positional argument: 'is_target_method_a_constructor'
+    all_callees = code_analyzer.get_all_callees(LOG, PRINT_COLLECTION_SIG, True)
+    assert all_callees is not None
+    assert isinstance(all_callees, dict)
+    assert "callee_details" in all_callees
+    assert len(all_callees["callee_details"]) == 2
+
+
+def test_get_all_classes(code_analyzer):
     """Should return all of the classes in an application"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        all_classes = code_analyzer.get_all_classes()
-        assert all_classes is not None
-        assert isinstance(all_classes, Dict)
-        assert len(all_classes) > 0
-        # Validate structure
-        for _, a_class in all_classes.items():
-            assert a_class is not None
-            assert isinstance(a_class, JType)
-
-
-def test_get_class(test_fixture, analysis_json):
-    """Should return a class given the qualified name"""
+    all_classes = code_analyzer.get_all_classes()
+    assert all_classes is not None
+    assert isinstance(all_classes, dict)
+    assert len(all_classes) > 0
+    # Validate structure
+    assert all(isinstance(a_class, JType) for a_class in all_classes.values())
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
 
-        class_info = code_analyzer.get_class("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect")
-        assert class_info is not None
-        assert isinstance(class_info, JType)
+def test_get_class(code_analyzer):
+    """Should return a class given the qualified name"""
 
+    class_info = code_analyzer.get_class(TRADE_DIRECT)
+    assert class_info is not None
+    assert isinstance(class_info, JType)
 
-def test_get_method(test_fixture, analysis_json):
+
+def test_get_method(code_analyzer):
     """Should return the method"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        method = code_analyzer.get_method("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect", "publishQuotePriceChange(com.ibm.websphere.samples.daytrader.entities.QuoteDataBean, java.math.BigDecimal, java.math.BigDecimal, double)")
-        assert method is not None
-        assert isinstance(method, JCallable)
+    method = code_analyzer.get_method(TRADE_DIRECT, PUBLISH_QUOTE_PRICE_CHANGE_SIG)
+    assert method is not None
+    assert isinstance(method, JCallable)
 
 
-def test_get_java_file(test_fixture, analysis_json):
+def test_get_java_file(code_analyzer):
     """Should return the java file for a class"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        java_file = code_analyzer.get_java_file("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect")
-        assert java_file is not None
-        assert isinstance(java_file, str)
-        relative_file = java_file.split("/src/")[1]
-        assert relative_file == "main/java/com/ibm/websphere/samples/daytrader/impl/direct/TradeDirect.java"
-
-        # Test compilation unit for this file
-        comp_unit = code_analyzer.get_java_compilation_unit(java_file)
-        assert comp_unit is not None
-        assert isinstance(comp_unit, JCompilationUnit)
-
-
-def test_get_all_methods_in_class(test_fixture, analysis_json):
-    """Should return all of the methods for a class"""
+    java_file = code_analyzer.get_java_file(TRADE_DIRECT)
+    assert java_file is not None
+    assert isinstance(java_file, str)
+    relative_file = java_file.split("/src/")[1]
+    assert relative_file == "main/java/com/ibm/websphere/samples/daytrader/impl/direct/TradeDirect.java"
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        all_methods = code_analyzer.get_all_methods_in_class("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect")
-        assert all_methods is not None
-        assert isinstance(all_methods, Dict)
-        assert len(all_methods) > 0
-        # Validate structure
-        for _, method in all_methods.items():
-            assert method is not None
-            assert isinstance(method, JCallable)
-
-
-def test_get_all_constructors(test_fixture, analysis_json):
-    """Should return all of the constructors for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Test if it finds the 3 constructors in AccountDataBean
-        all_constructors = code_analyzer.get_all_constructors("com.ibm.websphere.samples.daytrader.entities.AccountDataBean")
-        assert all_constructors is not None
-        assert isinstance(all_constructors, Dict)
-        assert len(all_constructors) == 3
-        # Validate structure
-        for _, constructor in all_constructors.items():
-            assert constructor is not None
-            assert isinstance(constructor, JCallable)
-
-        # Test class with no constructors
-        all_constructors = code_analyzer.get_all_constructors("com.ibm.websphere.samples.daytrader.util.FinancialUtils")
-        assert all_constructors is not None
-        assert isinstance(all_constructors, Dict)
-        assert len(all_constructors) == 0
-
-
-def test_get_all_sub_classes(test_fixture, analysis_json):
-    """Should return all of the subclasses for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        all_subclasses = code_analyzer.get_all_sub_classes("javax.ws.rs.core.Application")
-        assert all_subclasses is not None
-        assert isinstance(all_subclasses, Dict)
-        assert len(all_subclasses) == 1
-        assert "com.ibm.websphere.samples.daytrader.jaxrs.JAXRSApplication" in all_subclasses
-
-
-def test_get_all_fields(test_fixture, analysis_json):
-    """Should return all of the fields for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        all_fields = code_analyzer.get_all_fields("com.ibm.websphere.samples.daytrader.entities.AccountDataBean")
-        assert all_fields is not None
-        assert isinstance(all_fields, List)
-        assert len(all_fields) == 12
-
-        # Handle get fields for class not found
-        all_fields = code_analyzer.get_all_fields("com.not.Found")
-        assert all_fields is not None
-        assert isinstance(all_fields, List)
-        assert len(all_fields) == 0
-
-
-def test_get_all_nested_classes(test_fixture, analysis_json):
-    """Should return all the nested classes for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
+    # Test compilation unit for this file
+    comp_unit = code_analyzer.get_java_compilation_unit(java_file)
+    assert comp_unit is not None
+    assert isinstance(comp_unit, JCompilationUnit)
 
-        # TODO: Test with a KeyBlock that has nested KeyBlockIterator. This should return 1.
 
-        # Handle class not found
-        all_nested_classes = code_analyzer.get_all_nested_classes("com.not.Found")
-        assert all_nested_classes is not None
-        assert isinstance(all_nested_classes, List)
-        assert len(all_nested_classes) == 0
-
-
-def test_get_extended_classes(test_fixture, analysis_json):
-    """Should return all of the extended classes for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        all_extended_classes = code_analyzer.get_extended_classes("com.ibm.websphere.samples.daytrader.util.TradeRunTimeModeLiteral")
-        assert all_extended_classes is not None
-        assert isinstance(all_extended_classes, List)
-        assert len(all_extended_classes) == 1
-        assert "javax.enterprise.util.AnnotationLiteral<com.ibm.websphere.samples.daytrader.interfaces.RuntimeMode>" in all_extended_classes
-
-        # Test with class that is not extended
-        all_extended_classes = code_analyzer.get_extended_classes("com.ibm.websphere.samples.daytrader.entities.HoldingDataBean")
-        assert all_extended_classes is not None
-        assert isinstance(all_extended_classes, List)
-        assert len(all_extended_classes) == 0
-
-
-def test_get_implemented_interfaces(test_fixture, analysis_json):
-    """Should return all of the implemented interfaces for a class"""
-
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Call class that implements 2 interfaces
-        all_interfaces = code_analyzer.get_implemented_interfaces("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect")
-        assert all_interfaces is not None
-        assert isinstance(all_interfaces, List)
-        assert len(all_interfaces) == 2
-        assert "com.ibm.websphere.samples.daytrader.interfaces.TradeServices" in all_interfaces
-        assert "java.io.Serializable" in all_interfaces
-
-        # Call class that implements no interfaces
-        all_interfaces = code_analyzer.get_implemented_interfaces("com.ibm.websphere.samples.daytrader.util.TradeConfig")
-        assert all_interfaces is not None
-        assert isinstance(all_interfaces, List)
-        assert len(all_interfaces) == 0
-
-
-def test_get_class_call_graph_using_symbol_table(test_fixture, analysis_json):
+def test_get_all_methods_in_class(code_analyzer):
+    """Should return all of the methods for a class"""
+
+    all_methods = code_analyzer.get_all_methods_in_class(TRADE_DIRECT)
+    assert all_methods is not None
+    assert isinstance(all_methods, dict)
+    assert len(all_methods) > 0
+    # Validate structure
+    assert all(isinstance(method, JCallable) for method in all_methods.values())
+
+
+@pytest.mark.parametrize(
+    ("query", "qualified_class_name", "expected_type", "expected_len", "expected_members", "member_type"),
+    [
+        # AccountDataBean declares 3 constructors; FinancialUtils declares none.
+        pytest.param("get_all_constructors", ACCOUNT_DATA_BEAN, dict, 3, [], JCallable, id="constructors"),
+        pytest.param("get_all_constructors", "com.ibm.websphere.samples.daytrader.util.FinancialUtils", dict, 0, [], None, id="no-constructors"),
+        pytest.param(
+            "get_all_sub_classes", "javax.ws.rs.core.Application", dict, 1, ["com.ibm.websphere.samples.daytrader.jaxrs.JAXRSApplication"], None, id="sub-classes"
+        ),
+        pytest.param("get_all_fields", ACCOUNT_DATA_BEAN, list, 12, [], None, id="fields"),
+        pytest.param("get_all_fields", "com.not.Found", list, 0, [], None, id="fields-class-not-found"),
+        # TODO: Test with a KeyBlock that has nested KeyBlockIterator. This should return 1.
+        pytest.param("get_all_nested_classes", "com.not.Found", list, 0, [], None, id="nested-classes-class-not-found"),
+        pytest.param(
+            "get_extended_classes",
+            "com.ibm.websphere.samples.daytrader.util.TradeRunTimeModeLiteral",
+            list,
+            1,
+            ["javax.enterprise.util.AnnotationLiteral<com.ibm.websphere.samples.daytrader.interfaces.RuntimeMode>"],
+            None,
+            id="extended-classes",
+        ),
+        pytest.param("get_extended_classes", "com.ibm.websphere.samples.daytrader.entities.HoldingDataBean", list, 0, [], None, id="no-extended-classes"),
+        pytest.param(
+            "get_implemented_interfaces",
+            TRADE_DIRECT,
+            list,
+            2,
+            ["com.ibm.websphere.samples.daytrader.interfaces.TradeServices", "java.io.Serializable"],
+            None,
+            id="implemented-interfaces",
+        ),
+        pytest.param("get_implemented_interfaces", "com.ibm.websphere.samples.daytrader.util.TradeConfig", list, 0, [], None, id="no-implemented-interfaces"),
+    ],
+)
+def test_class_queries(code_analyzer, query, qualified_class_name, expected_type, expected_len, expected_members, member_type):
+    """Should return the constructors, subclasses, fields, nested classes, extended classes or interfaces of a class"""
+    result = getattr(code_analyzer, query)(qualified_class_name)
+    assert result is not None
+    assert isinstance(result, expected_type)
+    assert len(result) == expected_len
+    for member in expected_members:
+        assert member in result
+    if member_type is not None:
+        for member in result.values() if isinstance(result, dict) else result:
+            assert isinstance(member, member_type)
+
+
+def test_get_class_call_graph_using_symbol_table(code_analyzer):
     """Should return the call graph using the symbol table"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Call without method signature
-        all_call_graph = code_analyzer.get_class_call_graph_using_symbol_table("com.ibm.websphere.samples.daytrader" ".impl.direct.AsyncOrder", None)
-        assert all_call_graph is not None
-        assert isinstance(all_call_graph, List)
-
-        # TODO: Check this assertion below
-        # assert len(all_call_graph) > 0
-        # TODO: test with method signature
-
-
-def test_get_class_call_graph(test_fixture, analysis_json):
+    # Call without method signature
+    all_call_graph = code_analyzer.get_class_call_graph_using_symbol_table("com.ibm.websphere.samples.daytrader" ".impl.direct.AsyncOrder", None)
+    assert all_call_graph is not None
+    assert isinstance(all_call_graph, list)
+
+    # TODO: Check this assertion below
+    # assert len(all_call_graph) > 0
+    # TODO: test with method signature
+
+
+def test_get_class_call_graph(code_analyzer):
     """Should return the call graph"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-
-        # Call with method signature
-        class_call_graph = code_analyzer.get_class_call_graph(
-            "com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect", "createHolding(java.sql.Connection, int, java.lang.String, double, java.math.BigDecimal)"
-        )
-        assert class_call_graph is not None
-        assert isinstance(class_call_graph, List)
-        assert len(class_call_graph) == 4
-        for method in class_call_graph:
-            assert isinstance(method, Tuple)
-            assert isinstance(method[0], JMethodDetail)
-            assert isinstance(method[1], JMethodDetail)
-
-        # Call without method signature
-        class_call_graph = code_analyzer.get_class_call_graph("com.ibm.websphere.samples.daytrader.impl.direct.TradeDirect", None)
-        assert class_call_graph is not None
-        assert isinstance(class_call_graph, List)
-        assert len(class_call_graph) > 0
-
-
-def test_get_all_methods_in_application(test_fixture, analysis_json):
+    # Call without method signature
+    class_call_graph = code_analyzer.get_class_call_graph(TRADE_DIRECT, None)
+    assert class_call_graph is not None
+    assert isinstance(class_call_graph, list)
+    assert len(class_call_graph) > 0
+
+    # Call with method signature: the edges of the class's call graph that leave that method
+    method_call_graph = code_analyzer.get_class_call_graph(TRADE_DIRECT, CREATE_HOLDING_SIG)
+    assert isinstance(method_call_graph, list)
+    assert len(method_call_graph) == 4
+    assert all(isinstance(edge, tuple) and isinstance(edge[0], JMethodDetail) and isinstance(edge[1], JMethodDetail) for edge in method_call_graph)
+    assert method_call_graph == [edge for edge in class_call_graph if edge[0].method.signature == CREATE_HOLDING_SIG]
+
+    # Call with the signature of a method that is not in the call graph
+    assert code_analyzer.get_class_call_graph(TRADE_DIRECT, "doesNotExist()") == []
+
+
+def test_get_all_methods_in_application(code_analyzer):
     """Should return all of the methods in an application"""
 
-    # Patch subprocess so that it does not run codeanalyzer
-    with patch("cldk.analysis.java.codeanalyzer.codeanalyzer.subprocess.run") as run_mock:
-        run_mock.return_value = MagicMock(stdout=analysis_json, returncode=0)
-        code_analyzer = JCodeanalyzer(
-            project_dir=test_fixture,
-            source_code=None,
-            analysis_json_path=None,
-            analysis_level=AnalysisLevel.call_graph,
-            eager_analysis=False,
-            target_files=None,
-        )
-        all_methods = code_analyzer.get_all_methods_in_application()
-        assert all_methods is not None
-        assert isinstance(all_methods, Dict)
-        assert len(all_methods) > 0
-        # Validate structure
-        for _, method in all_methods.items():
-            assert method is not None
-            assert isinstance(method, Dict)
-            for _, callable in method.items():
-                assert callable is not None
-                assert isinstance(callable, JCallable)
-
-
-def test_get_all_entrypoint_methods_in_application(test_fixture, codeanalyzer_backend_path):
+    all_methods = code_analyzer.get_all_methods_in_application()
+    assert all_methods is not None
+    assert isinstance(all_methods, dict)
+    assert len(all_methods) > 0
+    # Validate structure
+    assert all(isinstance(methods, dict) for methods in all_methods.values())
+    assert all(isinstance(callable, JCallable) for methods in all_methods.values() for callable in methods.values())
+
+
+@pytest.mark.jvm
+def test_get_all_entrypoint_methods_in_application(symbol_table_analyzer):
     """Should return all of the entrypoint methods in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture,
-        source_code=None,
-        analysis_json_path=None,
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=False,
-        target_files=None,
-    )
-    entrypoint_methods = code_analyzer.get_all_entry_point_methods()
+    entrypoint_methods = symbol_table_analyzer.get_all_entry_point_methods()
     assert entrypoint_methods is not None
-    assert isinstance(entrypoint_methods, Dict)
+    assert isinstance(entrypoint_methods, dict)
     assert len(entrypoint_methods) > 0
     # Validate structure
-    for _, method in entrypoint_methods.items():
+    for method in entrypoint_methods.values():
         assert method is not None
-        assert isinstance(method, Dict)
-        for _, callable in method.items():
+        assert isinstance(method, dict)
+        for callable in method.values():
             assert callable is not None
             assert isinstance(callable, JCallable)
             assert callable.is_entrypoint
 
 
+@pytest.mark.jvm
 def test_source_analysis_imports_disambiguate_static_and_wildcard(codeanalyzer_backend_path) -> None:
     """Should preserve static and wildcard import metadata for colliding import paths."""
     source_code = "import static Foo.bar;\nimport Foo.bar.*;\nclass T {}"
@@ -871,160 +561,66 @@ def test_source_analysis_imports_disambiguate_static_and_wildcard(codeanalyzer_b
     assert wildcard_import.is_static is False
 
 
-def test_get_all_entrypoint_classes_in_the_application(test_fixture, codeanalyzer_backend_path):
+@pytest.mark.jvm
+def test_get_all_entrypoint_classes_in_the_application(symbol_table_analyzer):
     """Should return all of the entrypoint classes in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture,
-        source_code=None,
-        analysis_json_path=None,
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=False,
-        target_files=None,
-    )
-    entrypoint_classes = code_analyzer.get_all_entry_point_classes()
+    entrypoint_classes = symbol_table_analyzer.get_all_entry_point_classes()
     assert entrypoint_classes is not None
-    assert isinstance(entrypoint_classes, Dict)
+    assert isinstance(entrypoint_classes, dict)
     assert len(entrypoint_classes) > 0
     # Validate structure
-    for _, cls in entrypoint_classes.items():
+    for cls in entrypoint_classes.values():
         assert cls is not None
         assert isinstance(cls, JType)
         assert cls.is_entrypoint_class
 
 
-def test_get_all_get_crud_operations(test_fixture_pbw, codeanalyzer_backend_path):
+@pytest.mark.jvm
+def test_get_all_get_crud_operations(crud_analyzer_pbw):
     """Should return all of the CRUD operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture_pbw,
-        source_code=None,
-        analysis_json_path=test_fixture_pbw / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
-    )
-    crud_operations = code_analyzer.get_all_crud_operations()
-    assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value in ["CREATE", "READ", "UPDATE", "DELETE"]
-
-
-def test_get_all_get_crud_read_operations(test_fixture_pbw, codeanalyzer_backend_path):
-    """Should return all of the CRUD read operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture_pbw,
-        source_code=None,
-        analysis_json_path=test_fixture_pbw / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
-    )
-    crud_operations = code_analyzer.get_all_read_operations()
+    crud_operations = crud_analyzer_pbw.get_all_crud_operations()
     assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value == "READ"
-
-
-def test_get_all_get_crud_create_operations(test_fixture_pbw, codeanalyzer_backend_path):
-    """Should return all of the CRUD create operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture_pbw,
-        source_code=None,
-        analysis_json_path=test_fixture_pbw / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
+    assert all(isinstance(operation, dict) and isinstance(operation["crud_operations"], list) for operation in crud_operations)
+    assert all(
+        isinstance(crud_op, JCRUDOperation) and crud_op.line_number > 0 and crud_op.operation_type.value in CRUD_OPERATION_TYPES
+        for operation in crud_operations
+        for crud_op in operation["crud_operations"]
     )
-    crud_operations = code_analyzer.get_all_create_operations()
-    assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value == "CREATE"
-
-
-def test_get_all_get_crud_update_operations(test_fixture_pbw, codeanalyzer_backend_path):
-    """Should return all of the CRUD update operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture_pbw,
-        source_code=None,
-        analysis_json_path=test_fixture_pbw / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
-    )
-    crud_operations = code_analyzer.get_all_update_operations()
+
+
+@pytest.mark.jvm
+@pytest.mark.parametrize(
+    ("op_type", "query"),
+    [
+        pytest.param("CREATE", "get_all_create_operations", id="create"),
+        pytest.param("READ", "get_all_read_operations", id="read"),
+        pytest.param("UPDATE", "get_all_update_operations", id="update"),
+        pytest.param("DELETE", "get_all_delete_operations", id="delete"),
+    ],
+)
+def test_get_all_get_crud_operations_by_type(crud_analyzer_pbw, op_type, query):
+    """Should return the CRUD operations of one type in an application"""
+    # Each per-type query is the full CRUD listing with every other operation type filtered out.
+    expected = [[crud_op for crud_op in operation["crud_operations"] if crud_op.operation_type.value == op_type] for operation in crud_analyzer_pbw.get_all_crud_operations()]
+    crud_operations = getattr(crud_analyzer_pbw, query)()
     assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value == "UPDATE"
-
-
-def test_get_all_get_crud_delete_operations(test_fixture_pbw, codeanalyzer_backend_path):
-    """Should return all of the CRUD delete operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture_pbw,
-        source_code=None,
-        analysis_json_path=test_fixture_pbw / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
+    assert [operation["crud_operations"] for operation in crud_operations] == expected
+    assert all(isinstance(operation, dict) and isinstance(operation["crud_operations"], list) for operation in crud_operations)
+    assert all(
+        isinstance(crud_op, JCRUDOperation) and crud_op.line_number > 0 and crud_op.operation_type.value == op_type
+        for operation in crud_operations
+        for crud_op in operation["crud_operations"]
     )
-    crud_operations = code_analyzer.get_all_delete_operations()
-    assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value == "DELETE"
-
-
-def test_get_all_get_crud_operations_daytrader8(test_fixture, codeanalyzer_backend_path):
+
+
+@pytest.mark.jvm
+def test_get_all_get_crud_operations_daytrader8(crud_analyzer_daytrader):
     """Should return all of the CRUD operations in an application"""
-    code_analyzer = JCodeanalyzer(
-        project_dir=test_fixture,
-        source_code=None,
-        analysis_json_path=test_fixture / "build",
-        analysis_level=AnalysisLevel.symbol_table,
-        eager_analysis=True,
-        target_files=None,
-    )
-    crud_operations = code_analyzer.get_all_crud_operations()
+    crud_operations = crud_analyzer_daytrader.get_all_crud_operations()
     assert crud_operations is not None
-    for operation in crud_operations:
-        assert operation is not None
-        assert isinstance(operation, Dict)
-        assert isinstance(operation["crud_operations"], list)
-        for crud_op in operation["crud_operations"]:
-            assert crud_op is not None
-            assert isinstance(crud_op, JCRUDOperation)
-            assert crud_op.line_number > 0
-            assert crud_op.operation_type.value in ["CREATE", "READ", "UPDATE", "DELETE"]
+    assert all(isinstance(operation, dict) and isinstance(operation["crud_operations"], list) for operation in crud_operations)
+    assert all(
+        isinstance(crud_op, JCRUDOperation) and crud_op.line_number > 0 and crud_op.operation_type.value in CRUD_OPERATION_TYPES
+        for operation in crud_operations
+        for crud_op in operation["crud_operations"]
+    )
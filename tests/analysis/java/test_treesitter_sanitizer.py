@@ -0,0 +1,219 @@
+################################################################################
+# Copyright IBM Corporation 2026
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+"""
+TreesitterSanitizer Tests
+"""
+import pytest
+
+from cldk.utils.sanitization.java import TreesitterSanitizer
+
+FIELDS = """class A {
+    private int usedInConstructor;
+    private int usedInMethod;
+    private int unused;
+
+    A() { usedInConstructor = 1; }
+
+    int f() { return usedInMethod; }
+}"""
+
+IMPORTS = """import java.util.List;
+import java.util.Map;
+import java.io.*;
+
+class A {
+    class Inner {
+        List<String> names;
+    }
+}"""
+
+
+def test_remove_unused_fields_keeps_fields_used_by_methods_and_constructors():
+    """drop only the field no method or constructor references"""
+    pruned = TreesitterSanitizer(FIELDS).remove_unused_fields(FIELDS)
+
+    assert "usedInConstructor;" in pruned
+    assert "usedInMethod;" in pruned
+    assert "unused;" not in pruned
+
+
+def test_remove_unused_imports_sees_identifiers_in_nested_classes():
+    """keep imports referenced anywhere in the class, and wildcard imports"""
+    pruned = TreesitterSanitizer(IMPORTS).remove_unused_imports(IMPORTS)
+
+    assert "import java.util.List;" in pruned
+    assert "import java.io.*;" in pruned
+    assert "import java.util.Map;" not in pruned
+
+
+def test_sanitize_focal_class_parses_the_original_source_once(monkeypatch):
+    """reuse the tree of the original source across pruning steps"""
+    from cldk.utils.sanitization.java import treesitter_sanitizer
+
+    parsed = []
+    parse = treesitter_sanitizer._parse
+    monkeypatch.setattr(treesitter_sanitizer, "_parse", lambda code: parsed.append(code) or parse(code))
+
+    sanitized = TreesitterSanitizer(FIELDS).sanitize_focal_class("int f() { return usedInMethod; }")
+
+    assert "int f()" in sanitized
+    assert parsed.count(FIELDS.encode("utf-8")) == 1
+    assert all(isinstance(code, bytes) for code in parsed)
+
+
+def test_keep_only_focal_method_drops_every_overload_of_an_unused_method():
+    """splice out each unused declaration, not just the last body seen for its name"""
+    source = "class A {\n    void keep() { }\n    void drop(int a) { }\n    void drop(String s) { }\n}"
+
+    pruned = TreesitterSanitizer(source).keep_only_focal_method_and_its_callees("keep")
+
+    assert "void keep()" in pruned
+    assert "drop" not in pruned
+
+
+def test_call_graph_follows_every_overload_and_enclosing_method():
+    """credit calls to all overloads of a name and to every method enclosing the call"""
+    source = """class A {
+    void a() { b(1); }
+    void b(String s) { c(); }
+    void b(int i) { }
+    void c() { Runnable r = new Runnable() { public void run() { d(); } }; }
+    void d() { }
+    void e() { }
+}"""
+
+    pruned = TreesitterSanitizer(source).keep_only_focal_method_and_its_callees("a")
+
+    assert all(f"void {name}(" in pruned for name in "abcd")
+    assert "void e()" not in pruned
+
+
+def test_remove_unused_classes_ignores_references_from_unused_inner_classes():
+    """follow type references outward-in, skipping the bodies of inner classes"""
+    source = """class A {
+    Used used;
+    class Used { }
+    class Unused { OnlyFromUnused o; }
+    class OnlyFromUnused { }
+}"""
+    pruned = TreesitterSanitizer(source).remove_unused_classes(source)
+
+    assert "class Used" in pruned
+    assert "class Unused" not in pruned
+    assert "class OnlyFromUnused" not in pruned
+
+
+def test_identifiers_are_interned():
+    """collect identifiers as interned strings"""
+    import sys
+
+    from cldk.analysis.commons.treesitter import TreesitterJava
+    from cldk.utils.sanitization.java.treesitter_sanitizer import _identifiers
+
+    identifiers = _identifiers(TreesitterJava().get_raw_ast(FIELDS).root_node)
+
+    assert {"usedInConstructor", "usedInMethod", "unused", "A"} <= identifiers
+    assert all(sys.intern(identifier) is identifier for identifier in identifiers)
+
+
+def test_remove_unused_fields_does_not_count_shared_type_names_as_uses():
+    """a method using the field's type, but not the field, leaves it unused"""
+    source = "class A {\n    private List<String> names;\n    void f() { List<String> other = null; }\n}"
+
+    pruned = TreesitterSanitizer(source).remove_unused_fields(source)
+
+    assert "names;" not in pruned
+    assert "List<String> other" in pruned
+
+
+def test_sanitize_many_matches_sanitizing_one_by_one():
+    """fan classes out to worker processes and keep the input order"""
+    pairs = [
+        ("class A {\n    void keep() { }\n    void drop() { }\n}", "void keep() { }"),
+        (FIELDS, "int f() { return usedInMethod; }"),
+    ]
+
+    expected = [TreesitterSanitizer(source).sanitize_focal_class(method) for source, method in pairs]
+
+    assert TreesitterSanitizer.sanitize_many(pairs, max_workers=2) == expected
+    assert TreesitterSanitizer.sanitize_many(pairs, max_workers=1) == expected
+    assert TreesitterSanitizer.sanitize_many([]) == []
+
+
+def test_keep_only_focal_method_follows_cyclic_and_shared_callees():
+    """visit each reachable method once, however many callers or cycles lead to it"""
+    source = "class A {\n    void a() { b(); c(); }\n    void b() { a(); d(); }\n    void c() { d(); }\n    void d() { d(); }\n    void e() { a(); }\n}"
+
+    pruned = TreesitterSanitizer(source).keep_only_focal_method_and_its_callees("a")
+
+    assert all(f"void {name}()" in pruned for name in "abcd")
+    assert "void e()" not in pruned
+
+
+def test_remove_unused_imports_reads_the_code_it_is_given():
+    """imports only the pruned-away code used are dropped, full import names are matched"""
+    source = "import java.io.IOException;\nimport java.io.Serializable;\n\nclass A implements Serializable {\n    void keep() { }\n    void drop() throws IOException { }\n}"
+    sanitizer = TreesitterSanitizer(source)
+
+    pruned = sanitizer.remove_unused_imports(sanitizer.keep_only_focal_method_and_its_callees("keep"))
+
+    assert "import java.io.Serializable;" in pruned
+    assert "IOException" not in pruned
+
+
+def test_sanitize_focal_class_prettifies_once(monkeypatch):
+    """chain the raw pruning steps and tidy only the final result"""
+    from cldk.analysis.commons.treesitter import TreesitterJava
+
+    prettified = []
+    make_pruned_code_prettier = TreesitterJava.make_pruned_code_prettier
+    monkeypatch.setattr(TreesitterJava, "remove_all_comments", lambda self, code: code)
+    monkeypatch.setattr(TreesitterJava, "make_pruned_code_prettier", lambda self, code: prettified.append(code) or make_pruned_code_prettier(self, code))
+
+    sanitized = TreesitterSanitizer(FIELDS).sanitize_focal_class("int f() { return usedInMethod; }")
+
+    assert len(prettified) == 1
+    assert "usedInMethod;" in sanitized
+    assert "unused;" not in sanitized
+
+
+def test_keep_only_focal_method_names_methods_by_their_own_declaration():
+    """a method wrapping an anonymous class keeps its own name, not the inner method's"""
+    source = "class A {\n    void keep() { Runnable r = new Runnable() { public void run() { } }; }\n    void drop() { }\n}"
+
+    for _ in range(5):
+        pruned = TreesitterSanitizer(source).keep_only_focal_method_and_its_callees("keep")
+        assert "void keep()" in pruned
+        assert "void drop()" not in pruned
+
+
+def test_sanitize_focal_class_returns_empty_when_the_focal_method_is_missing(monkeypatch):
+    """skip the pruning steps for a focal method the class does not declare"""
+    from cldk.analysis.commons.treesitter import TreesitterJava
+
+    monkeypatch.setattr(TreesitterJava, "make_pruned_code_prettier", lambda self, code: pytest.fail("pruning ran"))
+
+    assert TreesitterSanitizer(FIELDS).sanitize_focal_class("void missing() { }") == ""
+
+
+def test_keep_only_focal_method_drops_every_method_when_the_focal_method_is_missing():
+    """treat every declared method as unused instead of failing on the missing one"""
+    source = "class A {\n    void a() { }\n    void b() { a(); }\n}"
+
+    pruned = TreesitterSanitizer(source).keep_only_focal_method_and_its_callees("missing")
+
+    assert "void a()" not in pruned and "void b()" not in pruned
@@ -23,7 +23,9 @@ Neo4j backend is checked for byte-for-byte parity against this same logic in
 ``test_python_neo4j_backend.py`` when a server is available.
 """
 
+import pytest
 from codeanalyzer.schema.py_schema import PyApplication, PyCallable, PyCallsite, PyClass, PyModule
+from pydantic import ValidationError
 
 from cldk.analysis.python.codeanalyzer.codeanalyzer import PyCodeanalyzer
 
@@ -121,6 +123,12 @@ def test_overview_kind_and_owning_class():
     assert nested.class_signature is None
 
 
+def test_overviews_are_frozen():
+    overview = _backend().get_callables_overview()[0]
+    with pytest.raises(ValidationError):
+        overview.name = "renamed"
+
+
 def test_method_bodies_returns_only_requested_existing():
     bodies = _backend().get_method_bodies(["pkg.models.greet", "pkg.models.Entity.describe", "does.not.exist"])
     assert bodies == {
@@ -149,3 +157,10 @@ def test_callsites_for_keys_existing_signatures_only():
     assert set(sites) == {"pkg.models.Entity.describe", "pkg.models.greet"}
     assert [s.method_name for s in sites["pkg.models.Entity.describe"]] == ["greet"]
     assert sites["pkg.models.greet"] == []
+
+
+def test_iter_modules_streams_the_same_modules_as_get_modules():
+    backend = _backend()
+    modules = backend.iter_modules()
+    assert not isinstance(modules, list)
+    assert [m.file_path for m in modules] == [m.file_path for m in backend.get_modules()] == ["pkg/models.py"]
@@ -230,3 +230,24 @@ def test_get_method_still_resolves_class_methods_neo4j():
     assert method is not None
     assert method.signature == "pkg.models.Entity.greet"
     assert backend.get_method("pkg.models.Entity", "nope") is None
+
+
+def test_get_method_reuses_the_method_index_local(monkeypatch):
+    backend = _local_backend()
+    assert backend.get_method(MODULE_NAME, "entry").signature == ENTRY_SIG
+
+    # Resolved from the index built on the first lookup, not by re-aggregating the application.
+    monkeypatch.setattr(backend, "get_all_methods_in_application", lambda: {})
+    assert backend.get_method(MODULE_NAME, "helper").signature == HELPER_SIG
+    assert backend.get_method(MODULE_NAME, "missing") is None
+
+
+def test_invalidate_modules_reloads_module_keys_neo4j():
+    backend = _neo4j_backend()
+    backend._call_graph = object()
+    backend._run = lambda query, **params: [{"k": "pkg/mod.py"}, {"k": "pkg/new.py"}]
+
+    backend.invalidate_modules()
+
+    assert backend._modules == ["pkg/mod.py", "pkg/new.py"]
+    assert backend._call_graph is None
@@ -16,9 +16,12 @@
 
 """Tree-sitter Python helper tests."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from tree_sitter import Tree
 
 from cldk.analysis.commons.treesitter import TreesitterPython
+from cldk.analysis.commons.treesitter.treesitter_python import _parser
 
 
 def test_is_parsable_accepts_valid_code():
@@ -32,3 +35,23 @@ def test_is_parsable_rejects_invalid_code():
 def test_get_raw_ast_returns_tree():
     ast = TreesitterPython().get_raw_ast("x = 1")
     assert isinstance(ast, Tree)
+
+
+def test_bytes_input_is_accepted_as_is():
+    ts = TreesitterPython()
+    source = b"def f(): return 1"
+    assert ts.is_parsable(source)
+    assert ts.get_raw_ast(source).root_node.text == source
+
+
+def test_is_parsable_ignores_brackets_inside_strings():
+    assert TreesitterPython().is_parsable('x = "(" + "[" + "{"')
+
+
+def test_each_thread_reuses_its_own_parser():
+    assert _parser() is _parser()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker_parser = pool.submit(_parser).result()
+        assert worker_parser is pool.submit(_parser).result()
+        assert pool.submit(TreesitterPython().is_parsable, "def f(): return 1").result()
+    assert worker_parser is not _parser()
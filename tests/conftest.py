@@ -23,7 +23,6 @@ import os
 os.putenv("ASAN_DISABLE", "1")
 os.putenv("ASAN_OPTIONS", "verify_asan_link_order=0")
 
-import json
 from pdb import set_trace
 import shutil
 import zipfile
@@ -54,12 +53,8 @@ def analysis_json_fixture():
 @pytest.fixture(scope="session", autouse=True)
 def analysis_json(analysis_json_fixture) -> str:
     """Opens the analysis.json file and returns the contents as a json string"""
-    json_file = {}
-    # Read the json file and return it as a json string
-    with open(os.path.join(analysis_json_fixture, "analysis.json"), "r", encoding="utf-8") as json_data:
-        json_file = json.dumps(json.load(json_data))
-
-    return json_file
+    # The file already holds the json string: return it as is rather than decoding and re-encoding it.
+    return Path(analysis_json_fixture, "analysis.json").read_text(encoding="utf-8")
 
 
 @pytest.fixture(scope="session", autouse=True)
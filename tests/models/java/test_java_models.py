@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any
 from cldk import CLDK
 from cldk.analysis.commons.backend_config import CodeAnalyzerConfig
-from cldk.models.java.models import JCompilationUnit, JImport
+from cldk.models.java.models import JCallable, JCallSite, JCompilationUnit, JField, JGraphEdges, JImport, JMethodDetail
 
 
 def _build_compilation_unit_payload(imports: list[Any], import_declarations: list[Any] | None = None) -> dict[str, Any]:
@@ -102,6 +102,113 @@ def test_jcompilationunit_imports_round_trip_through_dump_apis() -> None:
         assert [(item.path, item.is_static, item.is_wildcard) for item in reparsed.import_declarations] == expected_declarations
 
 
+def test_placeholder_comments_share_one_instance() -> None:
+    """Should collapse placeholder field comments onto one shared instance and keep real ones."""
+    field = {"type": "int", "start_line": 1, "end_line": 1, "variables": ["x"], "modifiers": [], "annotations": []}
+    empty = {"content": None, "start_line": -1, "end_line": -1, "start_column": -1, "end_column": -1, "is_javadoc": False}
+    first = JField(comment=empty, **field)
+    second = JField.model_validate_json(JField(comment=empty, **field).model_dump_json())
+    assert first.comment is second.comment
+    real = JField(comment={**empty, "content": "// x", "start_line": 1}, **field)
+    assert real.comment is not first.comment
+    assert real.comment.content == "// x"
+    assert JField(comment=None, **field).comment is None
+
+
+def test_jmethoddetail_hash_follows_class_and_declaration() -> None:
+    """Should hash method details by their class and declaration."""
+    method = JCallable.model_construct(declaration="void run()")
+    detail = JMethodDetail(method_declaration="void run()", klass="com.acme.Job", method=method)
+    same = JMethodDetail(method_declaration="void run()", klass="com.acme.Job", method=method)
+    other = JMethodDetail(method_declaration="void run()", klass="com.acme.Task", method=method)
+    assert hash(detail) == hash(same)
+    assert len({detail, same, other}) == 2
+
+
+def _edge_end(type_declaration: str, callable_declaration: str) -> dict[str, Any]:
+    return {"file_path": "", "type_declaration": type_declaration, "signature": callable_declaration, "callable_declaration": callable_declaration}
+
+
+def test_jgraphedges_placeholder_parameters_follow_the_declaration() -> None:
+    """Should give library callables one placeholder parameter per declared type, and none for no-arg calls."""
+    edge = JGraphEdges(
+        source=_edge_end("lib.Source", "close()"),
+        target=_edge_end("lib.Target", "put(java.lang.String,int)"),
+        type="CALL_DEP",
+        weight="1",
+    )
+    assert edge.source.method.is_implicit
+    assert edge.source.method.parameters == []
+    assert [p.type for p in edge.target.method.parameters] == ["java.lang.String", "int"]
+
+    # Another library type with the same declaration gets equal placeholder parameters of its own.
+    other = JGraphEdges(source=_edge_end("lib.Other", "put(java.lang.String,int)"), target=_edge_end("lib.Target", "close()"), type="CALL_DEP", weight="1")
+    assert other.source.method is not edge.target.method
+    assert other.source.method.parameters == edge.target.method.parameters
+    assert all(a is not b for a, b in zip(other.source.method.parameters, edge.target.method.parameters))
+
+
+def test_jgraphedges_placeholder_parameters_are_not_shared_between_edges() -> None:
+    """Should keep a change to one edge's placeholder parameter out of every other edge."""
+    edge = JGraphEdges(source=_edge_end("lib.Mutated", "put(java.lang.String,int)"), target=_edge_end("lib.Target", "close()"), type="CALL_DEP", weight="1")
+    parameter = edge.source.method.parameters[0]
+    parameter.annotations.append("@X")
+    parameter.name = "p"
+
+    other = JGraphEdges(source=_edge_end("lib.Untouched", "put(java.lang.String,int)"), target=_edge_end("lib.Target", "close()"), type="CALL_DEP", weight="1")
+    assert other.source.method.parameters[0].annotations == []
+    assert other.source.method.parameters[0].name is None
+
+
+def test_jgraphedges_hash_follows_endpoints_and_type() -> None:
+    """Should hash call-graph edges by their endpoints and edge type."""
+
+    def edge(edge_type: str) -> JGraphEdges:
+        return JGraphEdges(source=_edge_end("lib.A", "a()"), target=_edge_end("lib.B", "b(int)"), type=edge_type, weight="1")
+
+    assert hash(edge("CALL_DEP")) == hash(edge("CALL_DEP"))
+    assert len({edge("CALL_DEP"), edge("CALL_DEP"), edge("CONTROL_DEP")}) == 2
+
+
+def test_heavy_models_repr_only_their_identity() -> None:
+    """Should keep the repr of compilation units and callables to their identifying field."""
+    compilation_unit = JCompilationUnit(**_build_compilation_unit_payload(imports=["java.util.List"]))
+    assert repr(compilation_unit) == "JCompilationUnit(file_path='/tmp/T.java')"
+    assert str(JCallable.model_construct(signature="run()", code="{ ... }")) == "signature='run()'"
+
+
+def test_repeated_type_names_are_interned() -> None:
+    """Should share one string object for a type name repeated across the symbol table."""
+
+    def field() -> JField:
+        # Build the strings at runtime so each field starts from its own copy.
+        return JField(comment=None, type="".join(["java.lang.", "String"]), start_line=1, end_line=1, variables=["x"], modifiers=["".join(["priv", "ate"])], annotations=[])
+
+    first, second = field(), field()
+    assert first.type is second.type
+    assert first.modifiers[0] is second.modifiers[0]
+
+
+def test_equal_crud_operations_share_one_instance() -> None:
+    """Should collapse a CRUD operation or query reported on several call sites onto one shared instance."""
+    site = {"comment": None, "method_name": "persist", "receiver_type": "EntityManager", "argument_types": [], "argument_expr": [], "is_constructor_call": False}
+    position = {"start_line": 7, "start_column": 1, "end_line": 7, "end_column": 9}
+    operation = {"line_number": 7, "operation_type": "CREATE"}
+    first = JCallSite(**site, **position, crud_operation=operation, crud_query=None)
+    second = JCallSite(**site, **position, crud_operation=dict(operation), crud_query=None)
+    other = JCallSite(**site, **position, crud_operation={"line_number": 8, "operation_type": "CREATE"}, crud_query=None)
+    assert first.crud_operation is second.crud_operation
+    assert other.crud_operation is not first.crud_operation
+    assert JCallSite(**site, **position, crud_operation=None, crud_query=None).crud_operation is None
+
+    query = {"line_number": 7, "query_arguments": ["SELECT a FROM Account a"], "query_type": "NAMED"}
+    first = JCallSite(**site, **position, crud_operation=None, crud_query=query)
+    second = JCallSite(**site, **position, crud_operation=None, crud_query=dict(query))
+    assert first.crud_query is second.crud_query
+    assert first.crud_query.query_arguments == ("SELECT a FROM Account a",)
+    assert hash(first.crud_query) == hash(second.crud_query)
+
+
 def test_get_class_call_graph(analysis_json_fixture, tmp_path):
     """The facade reuses a cached analysis.json from the language-keyed cache dir (<cache>/java)."""
     keyed = tmp_path / "java"